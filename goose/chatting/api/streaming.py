@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from typing import Any
 
+import orjson
 from fastapi import WebSocket  # type: ignore[import-not-found]
 from langchain_core.messages import AIMessageChunk, ToolMessage
 from starlette.websockets import WebSocketDisconnect, WebSocketState
@@ -19,10 +20,21 @@ from goose.testing.models.messages import Message, ToolCall
 
 logger = logging.getLogger(__name__)
 
+# Streamed tokens are coalesced into one "token" event once this many characters
+# are pending or this long has passed since the previous token event.
+TOKEN_FLUSH_CHARS = 256
+TOKEN_FLUSH_SECONDS = 0.01
+
+# The terminal event of every turn has a fixed shape, so it is serialized once.
+_MESSAGE_END = orjson.dumps({"type": "message_end", "data": {}})
+
 
 async def send_event(websocket: WebSocket, event_type: str, data: dict[str, Any]) -> bool:
     """Send a JSON event to the WebSocket.
 
+    Events are encoded with ``orjson`` and sent as binary frames of UTF-8 JSON,
+    since this runs for every streamed token batch.
+
     Args:
         websocket: The WebSocket connection.
         event_type: The event type (e.g., "token", "tool_call").
@@ -35,19 +47,133 @@ async def send_event(websocket: WebSocket, event_type: str, data: dict[str, Any]
         return False
 
     try:
-        await websocket.send_text(json.dumps({"type": event_type, "data": data}))
+        # orjson already produces UTF-8; a binary frame avoids decoding and re-encoding it.
+        await websocket.send_bytes(orjson.dumps({"type": event_type, "data": data}, option=orjson.OPT_NON_STR_KEYS))
         return True
     except WebSocketDisconnect:
         return False
 
 
+async def _send_message_end(websocket: WebSocket) -> bool:
+    """Send the pre-serialized ``message_end`` event; see ``send_event``."""
+    if websocket.client_state != WebSocketState.CONNECTED:
+        return False
+
+    try:
+        await websocket.send_bytes(_MESSAGE_END)
+        return True
+    except WebSocketDisconnect:
+        return False
+
+
+class _TokenBatcher:
+    """Coalesce streamed tokens into fewer websocket "token" events.
+
+    Send every other event through ``send`` so the client still sees tokens
+    and other events in stream order. Buffered tokens are also flushed by a
+    timer, so a pause in the upstream stream never holds them back for longer
+    than ``TOKEN_FLUSH_SECONDS``. The batcher also remembers the first failed
+    send: once the client is gone, every later call returns False without
+    touching the websocket.
+    """
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.connected = True
+        self._websocket = websocket
+        self._loop = asyncio.get_running_loop()
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_flush = self._loop.time()
+        # The timer flush runs as its own task, so sends are serialized to keep events in order.
+        self._send_lock = asyncio.Lock()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[bool] | None = None
+
+    async def add(self, content: str) -> bool:
+        """Buffer *content* and flush when the size or time threshold is reached.
+
+        Below both thresholds a timer is armed, so the buffer is flushed even if
+        no further token arrives.
+
+        Returns:
+            False if the connection is closed, True otherwise.
+        """
+        if not self.connected:
+            return False
+        self._pending.append(content)
+        self._pending_chars += len(content)
+        elapsed = self._loop.time() - self._last_flush
+        if self._pending_chars >= TOKEN_FLUSH_CHARS or elapsed >= TOKEN_FLUSH_SECONDS:
+            return await self.flush()
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(TOKEN_FLUSH_SECONDS - elapsed, self._flush_later)
+        return True
+
+    def _flush_later(self) -> None:
+        """Timer callback: flush the buffer from a task, keeping a reference so it is not collected."""
+        self._flush_handle = None
+        self._flush_task = self._loop.create_task(self.flush())
+
+    async def flush(self) -> bool:
+        """Send all buffered tokens as a single event.
+
+        Returns:
+            False if the connection is closed, True otherwise.
+        """
+        async with self._send_lock:
+            return await self._flush_locked()
+
+    async def _flush_locked(self) -> bool:
+        """Body of ``flush``; the caller must hold ``_send_lock``."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self.connected:
+            return False
+        if not self._pending:
+            return True
+        content = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        self._last_flush = self._loop.time()
+        self.connected = await send_event(self._websocket, "token", {"content": content})
+        return self.connected
+
+    async def send(self, event_type: str, data: dict[str, Any]) -> bool:
+        """Flush buffered tokens, then send one event.
+
+        Returns:
+            False if the connection is closed, True otherwise.
+        """
+        async with self._send_lock:
+            if not await self._flush_locked():
+                return False
+            self.connected = await send_event(self._websocket, event_type, data)
+            return self.connected
+
+    async def send_message_end(self) -> bool:
+        """Flush buffered tokens, then send the terminal ``message_end`` event."""
+        async with self._send_lock:
+            if not await self._flush_locked():
+                return False
+            self.connected = await _send_message_end(self._websocket)
+            return self.connected
+
+
+def _add_message(store: Any, conversation_id: str, message: Message) -> dict[str, Any]:
+    """Persist *message* and return its dump, so the same dict can be sent as the event payload."""
+    dumped = message.model_dump()
+    store.add_message(conversation_id, message, dumped=dumped)
+    return dumped
+
+
 def _parse_args_from_string(args_str: str) -> dict[str, Any]:
     """Parse JSON args string into a dict, returning empty dict on failure."""
     if not args_str:
         return {}
     try:
-        return json.loads(args_str)
-    except json.JSONDecodeError:
+        return orjson.loads(args_str)
+    except orjson.JSONDecodeError:
         logger.warning("Failed to parse tool call args: %s", args_str)
         return {}
 
@@ -56,16 +182,21 @@ def _accumulate_tool_chunk(
     chunks: dict[int, dict[str, Any]],
     tool_chunk: dict[str, Any],
 ) -> None:
-    """Accumulate a tool call chunk into the chunks dict."""
+    """Accumulate a tool call chunk into the chunks dict.
+
+    Name and args fragments are collected in lists and joined once in
+    ``_build_tool_call_from_chunk``, keeping accumulation linear in the
+    total args size.
+    """
     idx = tool_chunk.get("index", 0)
     if idx not in chunks:
-        chunks[idx] = {"name": "", "args": "", "id": ""}
+        chunks[idx] = {"name_parts": [], "args_parts": [], "id": ""}
 
     tc = chunks[idx]
     if tool_chunk.get("name"):
-        tc["name"] += tool_chunk["name"]
+        tc["name_parts"].append(tool_chunk["name"])
     if tool_chunk.get("args"):
-        tc["args"] += tool_chunk["args"]
+        tc["args_parts"].append(tool_chunk["args"])
     if tool_chunk.get("id"):
         tc["id"] = tool_chunk["id"]
 
@@ -73,8 +204,8 @@ def _accumulate_tool_chunk(
 def _build_tool_call_from_chunk(acc_tc: dict[str, Any]) -> ToolCall:
     """Build a ToolCall from an accumulated chunk."""
     return ToolCall(
-        name=acc_tc.get("name", ""),
-        args=_parse_args_from_string(acc_tc.get("args", "")),
+        name="".join(acc_tc["name_parts"]),
+        args=_parse_args_from_string("".join(acc_tc["args_parts"])),
         id=acc_tc.get("id"),
     )
 
@@ -104,7 +235,7 @@ def _coerce_goose_event(raw_event: GooseAgentEvent | dict[str, Any]) -> GooseAge
 
 
 async def _emit_in_band_error(
-    websocket: WebSocket,
+    tokens: _TokenBatcher,
     *,
     conversation_id: str,
     store: Any,
@@ -112,13 +243,12 @@ async def _emit_in_band_error(
 ) -> None:
     """Persist and emit a terminal in-band error message."""
     error_message = Message(type="error", content=message)
-    store.add_message(conversation_id, error_message)
-    await send_event(websocket, "message", error_message.model_dump())
-    await send_event(websocket, "message_end", {})
+    if await tokens.send("message", _add_message(store, conversation_id, error_message)):
+        await tokens.send_message_end()
 
 
 async def _emit_tool_output(
-    websocket: WebSocket,
+    tokens: _TokenBatcher,
     *,
     conversation_id: str,
     store: Any,
@@ -134,8 +264,7 @@ async def _emit_tool_output(
         tool_call_id=str(tool_call_id) if tool_call_id is not None else None,
     )
     store.add_message(conversation_id, tool_message)
-    return await send_event(
-        websocket,
+    return await tokens.send(
         "tool_output",
         {
             "tool_name": tool_message.tool_name,
@@ -160,7 +289,7 @@ async def stream_agent_response(
 
     Args:
         websocket: The WebSocket connection.
-        conversation: The conversation to add messages to.
+        conversation: A current snapshot of the conversation to add messages to.
         user_content: The user's message content.
     """
     store = get_store()
@@ -177,9 +306,9 @@ async def stream_agent_response(
         await send_event(websocket, "error", {"message": f"Agent not found: {conversation.agent_id}"})
         return
 
-    # Hot-reload source modules before each message
+    # Hot-reload source modules before each message, if any source file changed
     try:
-        reload_source_modules()
+        reload_source_modules(only_if_changed=True)
     except Exception as exc:
         logger.warning("Hot-reload failed: %s", exc)
 
@@ -191,18 +320,17 @@ async def stream_agent_response(
 
     # Add user message to store
     human_message = Message(type="human", content=user_content)
-    store.add_message(conversation.id, human_message)
-
-    # Echo user message back to client
-    await send_event(websocket, "message", human_message.model_dump())
-
-    # Build conversation history for the agent
-    updated_conversation = store.get(conversation.id)
-    if updated_conversation is None:
+    human_dump = human_message.model_dump()
+    if not store.add_message(conversation.id, human_message, dumped=human_dump):
         await send_event(websocket, "error", {"message": "Conversation not found"})
         return
 
-    messages = list(updated_conversation.messages)
+    # Echo user message back to client
+    await send_event(websocket, "message", human_dump)
+
+    # Build conversation history for the agent from the caller's fresh snapshot
+    # rather than re-fetching and re-validating the whole conversation.
+    messages = [*conversation.messages, human_message]
 
     # Get the pre-built agent from config
     agent = agent_config["agent"]
@@ -240,7 +368,9 @@ async def _stream_response(
         )
         return
 
-    langchain_messages = [msg.to_langchain() for msg in messages]
+    langchain_messages = store.get_langchain_messages(conversation_id)
+    if langchain_messages is None:
+        langchain_messages = [msg.to_langchain() for msg in messages]
     await _stream_langchain_response(websocket, agent, langchain_messages, conversation_id, store)
 
 
@@ -255,6 +385,7 @@ async def _stream_goose_response(
 ) -> None:
     """Stream a response from a Goose-native chat agent."""
     accumulated_content = ""
+    tokens = _TokenBatcher(websocket)
 
     try:
         async for raw_event in agent.astream_goose(conversation=conversation, messages=messages):
@@ -265,37 +396,37 @@ async def _stream_goose_response(
                 store.update_metadata(conversation_id, data)
                 continue
 
-            if event.type == "message":
-                message = Message.model_validate(data)
-                store.add_message(conversation_id, message)
-                if not await send_event(websocket, "message", message.model_dump()):
-                    return
-                continue
-
             if event.type == "token":
                 content = str(data.get("content") or "")
                 if not content:
                     continue
                 accumulated_content += content
-                if not await send_event(websocket, "token", {"content": content}):
+                if not await tokens.add(content):
+                    return
+                continue
+
+            if event.type == "message":
+                message = Message.model_validate(data)
+                if not await tokens.send("message", _add_message(store, conversation_id, message)):
                     return
                 continue
 
             if event.type == "tool_call":
                 tool_call = _build_tool_call_from_event(data)
-                store.add_message(
+                ai_dump = _add_message(
+                    store,
                     conversation_id,
                     Message(type="ai", content=accumulated_content, tool_calls=[tool_call]),
                 )
                 accumulated_content = ""
-                if not await send_event(websocket, "tool_call", tool_call.model_dump()):
+                if not await tokens.send("tool_call", ai_dump["tool_calls"][0]):
                     return
                 continue
 
             if event.type == "tool_output":
                 accumulated_content = ""
                 if not await _emit_tool_output(
-                    websocket,
+                    tokens,
                     conversation_id=conversation_id,
                     store=store,
                     data=data,
@@ -305,7 +436,7 @@ async def _stream_goose_response(
 
             if event.type == "error":
                 await _emit_in_band_error(
-                    websocket,
+                    tokens,
                     conversation_id=conversation_id,
                     store=store,
                     message=str(data.get("message") or "Unknown error"),
@@ -317,7 +448,7 @@ async def _stream_goose_response(
     except Exception as exc:
         logger.exception("Goose-native streaming failed")
         await _emit_in_band_error(
-            websocket,
+            tokens,
             conversation_id=conversation_id,
             store=store,
             message=str(exc),
@@ -328,7 +459,7 @@ async def _stream_goose_response(
         ai_message = Message(type="ai", content=accumulated_content, tool_calls=[])
         store.add_message(conversation_id, ai_message)
 
-    await send_event(websocket, "message_end", {})
+    await tokens.send_message_end()
 
 
 async def _stream_langchain_response(
@@ -341,17 +472,26 @@ async def _stream_langchain_response(
     """Stream the agent response and save messages."""
     accumulated_content = ""
     current_tool_call_chunks: dict[int, dict[str, Any]] = {}
+    tokens = _TokenBatcher(websocket)
 
     async def _flush_pending_tool_calls() -> tuple[bool, list[ToolCall]]:
         if not current_tool_call_chunks:
             return True, []
 
+        connected = await tokens.flush()
+        # Build, dump and send each tool call in a single pass; the AI message is stored afterwards
+        # with the same dumps, even if the client disconnected midway.
         pending_tool_calls: list[ToolCall] = []
+        tool_call_dumps: list[dict[str, Any]] = []
         for acc_tc in current_tool_call_chunks.values():
-            if not acc_tc.get("name"):
+            if not acc_tc["name_parts"]:
                 continue
             tc = _build_tool_call_from_chunk(acc_tc)
+            tc_dump = tc.model_dump()
             pending_tool_calls.append(tc)
+            tool_call_dumps.append(tc_dump)
+            if connected:
+                connected = await tokens.send("tool_call", tc_dump)
 
         if pending_tool_calls or accumulated_content:
             ai_message = Message(
@@ -359,11 +499,12 @@ async def _stream_langchain_response(
                 content=accumulated_content,
                 tool_calls=pending_tool_calls,
             )
-            store.add_message(conversation_id, ai_message)
+            ai_dump = ai_message.model_dump(exclude={"tool_calls"})
+            ai_dump["tool_calls"] = tool_call_dumps
+            store.add_message(conversation_id, ai_message, dumped=ai_dump)
 
-        for tc in pending_tool_calls:
-            if not await send_event(websocket, "tool_call", tc.model_dump()):
-                return False, pending_tool_calls
+        if not connected:
+            return False, pending_tool_calls
 
         current_tool_call_chunks.clear()
         return True, pending_tool_calls
@@ -377,7 +518,7 @@ async def _stream_langchain_response(
             if isinstance(chunk, AIMessageChunk):
                 if chunk.content:
                     accumulated_content += chunk.content
-                    if not await send_event(websocket, "token", {"content": chunk.content}):
+                    if not await tokens.add(chunk.content):
                         return
 
                 for tool_chunk in chunk.tool_call_chunks or []:
@@ -391,21 +532,22 @@ async def _stream_langchain_response(
                     return
                 accumulated_content = ""
 
+                tool_call_id = getattr(chunk, "tool_call_id", None)
+                tool_content = str(chunk.content)
                 tool_message = Message(
                     type="tool",
-                    content=str(chunk.content),
+                    content=tool_content,
                     tool_name=chunk.name,
-                    tool_call_id=getattr(chunk, "tool_call_id", None),
+                    tool_call_id=tool_call_id,
                 )
                 store.add_message(conversation_id, tool_message)
 
-                if not await send_event(
-                    websocket,
+                if not await tokens.send(
                     "tool_output",
                     {
                         "tool_name": chunk.name,
-                        "tool_call_id": getattr(chunk, "tool_call_id", None),
-                        "content": str(chunk.content),
+                        "tool_call_id": tool_call_id,
+                        "content": tool_content,
                     },
                 ):
                     return
@@ -430,9 +572,8 @@ async def _stream_langchain_response(
                 store.add_message(conversation_id, tool_message)
 
             error_message = Message(type="error", content=str(exc))
-            store.add_message(conversation_id, error_message)
-            await send_event(websocket, "message", error_message.model_dump())
-            await send_event(websocket, "message_end", {})
+            if await tokens.send("message", _add_message(store, conversation_id, error_message)):
+                await tokens.send_message_end()
             return
         raise
 
@@ -445,7 +586,7 @@ async def _stream_langchain_response(
         )
         store.add_message(conversation_id, ai_message)
 
-    await send_event(websocket, "message_end", {})
+    await tokens.send_message_end()
 
 
 __all__ = ["stream_agent_response", "send_event"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Any
 
 from goose.chatting.api.schema import Conversation, ConversationSummary
@@ -19,6 +20,8 @@ class ConversationStore:
 
     def __init__(self) -> None:
         self._conversations: dict[str, dict[str, Any]] = {}
+        # LangChain conversions of each conversation's messages, extended lazily.
+        self._langchain_messages: dict[str, list[Any]] = {}
         self._next_id = 1
 
     def create(self, agent_id: str, agent_name: str, title: str | None = None) -> Conversation:
@@ -82,7 +85,8 @@ class ConversationStore:
             )
             for data in self._conversations.values()
         ]
-        return sorted(summaries, key=lambda c: c.updated_at, reverse=True)
+        summaries.sort(key=attrgetter("updated_at"), reverse=True)
+        return summaries
 
     def delete(self, conversation_id: str) -> bool:
         """Delete a conversation.
@@ -95,15 +99,18 @@ class ConversationStore:
         """
         if conversation_id in self._conversations:
             del self._conversations[conversation_id]
+            self._langchain_messages.pop(conversation_id, None)
             return True
         return False
 
-    def add_message(self, conversation_id: str, message: Message) -> bool:
+    def add_message(self, conversation_id: str, message: Message, *, dumped: dict[str, Any] | None = None) -> bool:
         """Add a message to a conversation.
 
         Args:
             conversation_id: ID of the conversation.
             message: The message to add.
+            dumped: ``message.model_dump()``, when the caller already computed it.
+                The dict is stored as-is and must not be mutated afterwards.
 
         Returns:
             True if added, False if conversation not found.
@@ -112,7 +119,9 @@ class ConversationStore:
         if data is None:
             return False
 
-        data["messages"].append(message.model_dump())
+        if dumped is None:
+            dumped = message.model_dump()
+        data["messages"].append(dumped)
         data["updated_at"] = datetime.now(timezone.utc)
 
         # Auto-update title from first human message if still default
@@ -125,6 +134,28 @@ class ConversationStore:
 
         return True
 
+    def get_langchain_messages(self, conversation_id: str) -> list[Any] | None:
+        """Get a conversation's messages converted to LangChain message objects.
+
+        Conversions are cached per conversation and only messages added since
+        the previous call are converted, so each turn converts one or two
+        messages instead of the whole history.
+
+        Args:
+            conversation_id: ID of the conversation.
+
+        Returns:
+            A new list of LangChain messages, or None if the conversation is not found.
+        """
+        data = self._conversations.get(conversation_id)
+        if data is None:
+            return None
+
+        converted = self._langchain_messages.setdefault(conversation_id, [])
+        for dumped in data["messages"][len(converted) :]:
+            converted.append(Message(**dumped).to_langchain())
+        return list(converted)
+
     def update_title(self, conversation_id: str, title: str) -> bool:
         """Update a conversation's title.
 
@@ -168,6 +199,7 @@ class ConversationStore:
     def clear(self) -> None:
         """Clear all conversations."""
         self._conversations.clear()
+        self._langchain_messages.clear()
 
 
 class _StoreHolder:
@@ -10,12 +10,13 @@ This module provides the unified `goose` command with subcommands:
 
 from __future__ import annotations
 
+# pylint: disable=import-outside-toplevel
+
+import os
 from pathlib import Path
 
 import typer
-from uvicorn import Config, Server
 
-from goose.app import app as fastapi_app
 from goose.core.config import GooseConfig
 from goose.scaffolding.cli import init
 from goose.testing.cli import app as testing_app
@@ -36,6 +37,15 @@ app.command()(init)
 def api(
     host: str = typer.Option("127.0.0.1", "--host", help="Host interface to bind"),
     port: int = typer.Option(8730, "--port", help="Port to bind"),
+    jobs: int = typer.Option(
+        1,
+        "-j",
+        "--jobs",
+        "--concurrency",
+        envvar="GOOSE_MAX_CONCURRENCY",
+        min=1,
+        help="Number of tests a dashboard run executes concurrently. Requires thread-safe fixtures and hooks.",
+    ),
 ) -> None:
     """Start the Goose backend API.
 
@@ -73,12 +83,25 @@ def api(
 
     # Set reload targets from app + always include gooseapp
     config.reload_targets = config.compute_reload_targets()
+    config.max_concurrency = jobs
 
     typer.echo("Starting Goose API")
     typer.echo(f"  Tests: {config.TESTS_MODULE}")
     typer.echo(f"  Reload targets: {config.reload_targets}")
 
-    uvicorn_config = Config(app=fastapi_app, host=host, port=port, reload=True)
+    # The server and the FastAPI app are only needed here; importing them lazily keeps
+    # `goose --help`, `goose init` and `goose test` from loading the whole web stack.
+    from uvicorn import Config, Server
+
+    from goose.app import app as fastapi_app
+
+    # Source changes are picked up in-process by the reload targets above. uvicorn's own
+    # watcher needs an import string rather than an app object, so it is left disabled.
+    # uvicorn already picks uvloop when it is installed; honour the same opt-out as tool invocation.
+    loop = "auto"
+    if os.environ.get("GOOSE_DISABLE_UVLOOP") == "1":
+        loop = "asyncio"
+    uvicorn_config = Config(app=fastapi_app, host=host, port=port, loop=loop)
     server = Server(uvicorn_config)
     raise SystemExit(server.run())
 
@@ -88,10 +88,14 @@ class GooseApp:
 
         self.tools: list[Callable[..., Any]] = tools_list
 
-        # Process agents - assign sequential IDs and build lookup dict
+        # Process agents - assign sequential IDs, build lookup dict and validate unique names
         self._agents_by_id: dict[str, dict[str, Any]] = {}
+        names: set[str] = set()
         for idx, agent in enumerate(agents or [], start=1):
             self._validate_agent(agent)
+            if agent.name in names:
+                raise ValueError("Agent names must be unique")
+            names.add(agent.name)
             agent_id = str(idx)
             self._agents_by_id[agent_id] = {
                 "id": agent_id,
@@ -99,10 +103,8 @@ class GooseApp:
                 "agent": agent,
             }
 
-        # Validate unique names
-        names = [a["name"] for a in self._agents_by_id.values()]
-        if len(names) != len(set(names)):
-            raise ValueError("Agent names must be unique")
+        # Agents are fixed at construction, so the listing is built once and shared.
+        self._agents: tuple[dict[str, Any], ...] = tuple(self._agents_by_id.values())
 
     def _validate_agent(self, agent: Any) -> None:
         """Validate an agent has required attributes."""
@@ -115,8 +117,11 @@ class GooseApp:
 
     @property
     def agents(self) -> list[dict[str, Any]]:
-        """Return list of agent configs with IDs."""
-        return list(self._agents_by_id.values())
+        """Return list of agent configs with IDs, in registration order.
+
+        Each call returns a new list, copied from the listing built at construction.
+        """
+        return list(self._agents)
 
     def get_agent_config(self, agent_id: str) -> dict[str, Any] | None:
         """Get agent config by ID."""
@@ -30,6 +30,11 @@ class GooseConfig:
 
     _instance: GooseConfig | None = None
     _initialized: bool
+    _base_path: Path
+    _base_path_str: str
+    _gooseapp_dir: Path
+    _tests_dir: Path
+    _tests_parent_str: str
 
     # Fixed conventions
     GOOSEAPP_DIR = "gooseapp"
@@ -42,9 +47,10 @@ class GooseConfig:
         if cls._instance is None:
             instance = super().__new__(cls)
             instance._initialized = False
-            instance._base_path = Path.cwd()
+            instance._set_base_path(Path.cwd())
             instance._goose_app = None
             instance._reload_targets = []
+            instance._max_concurrency = 1
             cls._instance = instance
         return cls._instance
 
@@ -64,17 +70,40 @@ class GooseConfig:
 
     @base_path.setter
     def base_path(self, path: Path) -> None:
-        self._base_path = path
+        self._set_base_path(path)
+
+    @property
+    def base_path_str(self) -> str:
+        """String form of ``base_path``, as used for ``sys.path`` entries."""
+        return self._base_path_str
 
     @property
     def gooseapp_dir(self) -> Path:
         """Path to the gooseapp directory."""
-        return self._base_path / self.GOOSEAPP_DIR
+        return self._gooseapp_dir
 
     @property
     def tests_dir(self) -> Path:
         """Path to the tests directory."""
-        return self.gooseapp_dir / "tests"
+        return self._tests_dir
+
+    @property
+    def tests_parent_str(self) -> str:
+        """String form of the tests directory's parent, as used for ``sys.path`` entries."""
+        return self._tests_parent_str
+
+    def _set_base_path(self, path: Path) -> None:
+        """Store the base path and precompute every path derived from it.
+
+        Derived paths are read on every discovery and import-path check, so
+        they are built once here instead of being re-joined and re-stringified
+        on each access.
+        """
+        self._base_path = path
+        self._base_path_str = str(path)
+        self._gooseapp_dir = path / self.GOOSEAPP_DIR
+        self._tests_dir = self._gooseapp_dir / "tests"
+        self._tests_parent_str = str(self._tests_dir.parent)
 
     @property
     def goose_app(self) -> GooseApp | None:
@@ -94,6 +123,15 @@ class GooseConfig:
     def reload_targets(self, targets: list[str]) -> None:
         self._reload_targets = list(targets)
 
+    @property
+    def max_concurrency(self) -> int:
+        """Number of tests a dashboard run may execute at the same time."""
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value: int) -> None:
+        self._max_concurrency = value
+
     def exists(self) -> bool:
         """Check if gooseapp directory exists."""
         return self.gooseapp_dir.exists()
@@ -130,9 +168,8 @@ class GooseConfig:
             AttributeError: If 'app' is not found in the module.
         """
         # Ensure base_path is in sys.path for imports
-        path_str = str(self._base_path)
-        if path_str not in sys.path:
-            sys.path.insert(0, path_str)
+        if self._base_path_str not in sys.path:
+            sys.path.insert(0, self._base_path_str)
 
         app_path = f"{self.APP_MODULE}:{self.APP_VARIABLE}"
         self._goose_app = load_app(app_path)
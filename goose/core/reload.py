@@ -3,10 +3,22 @@
 from __future__ import annotations
 
 import importlib
+import os
 import sys
+import time
+from collections import deque
+from collections.abc import Collection
 
 from goose.core.config import GooseConfig
 
+# Source file mtime (ns) of each module as of its last reload by reload_modules.
+_reloaded_mtimes: dict[str, int] = {}
+
+# File mtimes come from a coarse clock (up to 2s on some filesystems), so an edit made right
+# after a reload may not move them. Only mtimes older than that are recorded; a module whose
+# file was written more recently counts as changed until it settles.
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
 
 def collect_submodules(package_name: str) -> list[str]:
     """Find all loaded modules under a package prefix."""
@@ -18,6 +30,21 @@ def collect_submodules(package_name: str) -> list[str]:
     return matches
 
 
+def _within_any(module_name: str, packages: set[str] | frozenset[str]) -> bool:
+    """Return True if *module_name* is one of *packages* or a submodule of one.
+
+    Walks the module's dotted ancestors, so the cost depends on the module's
+    depth rather than on the number of packages.
+    """
+    candidate = module_name
+    while True:
+        if candidate in packages:
+            return True
+        candidate, separator, _ = candidate.rpartition(".")
+        if not separator:
+            return False
+
+
 def reload_module(module_name: str) -> None:
     """Reload a single module by name.
 
@@ -74,28 +101,85 @@ def _build_dependency_graph(modules: set[str]) -> dict[str, set[str]]:
 
 
 def _topological_sort(modules: set[str], deps: dict[str, set[str]]) -> list[str]:
-    """Sort modules so dependencies come before dependents."""
-    reloaded: set[str] = set()
-    reload_order: list[str] = []
+    """Sort modules so dependencies come before dependents.
 
-    while len(reloaded) < len(modules):
-        progress = False
-        for module_name in modules:
-            if module_name in reloaded:
-                continue
-            if deps[module_name] <= reloaded:
-                reload_order.append(module_name)
-                reloaded.add(module_name)
-                progress = True
-        if not progress:
-            # Circular dependency - add remaining in any order
-            reload_order.extend(m for m in modules if m not in reloaded)
-            break
+    Uses Kahn's algorithm, visiting each module and dependency edge once.
+    Modules caught in (or depending on) a cycle are appended in any order.
+    """
+    waiting_on = {module_name: len(deps[module_name]) for module_name in modules}
+    dependents: dict[str, list[str]] = {}
+    for module_name in modules:
+        for dependency in deps[module_name]:
+            dependents.setdefault(dependency, []).append(module_name)
+
+    ready = deque(module_name for module_name, count in waiting_on.items() if count == 0)
+    reload_order: list[str] = []
+    while ready:
+        module_name = ready.popleft()
+        reload_order.append(module_name)
+        for dependent in dependents.get(module_name, ()):
+            waiting_on[dependent] -= 1
+            if waiting_on[dependent] == 0:
+                ready.append(dependent)
+
+    if len(reload_order) < len(modules):
+        # Circular dependency - add remaining in any order
+        reloaded = set(reload_order)
+        reload_order.extend(m for m in modules if m not in reloaded)
 
     return reload_order
 
 
-def reload_source_modules(*, extra_exclude_suffixes: list[str] | None = None) -> None:
+def _source_mtime(module_name: str) -> int:
+    """Return the mtime (ns) of a loaded module's source file, or -1 if it has none."""
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if not path:
+        return -1
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        # Deleted or unreadable; reported as a change so the reload can drop it.
+        return -2
+
+
+def _sources_changed(modules: Collection[str]) -> bool:
+    """Return True if any module's source file changed since it was last reloaded."""
+    return any(_reloaded_mtimes.get(module_name) != _source_mtime(module_name) for module_name in modules)
+
+
+def reload_modules(module_names: Collection[str], *, only_if_changed: bool = False) -> bool:
+    """Reload *module_names* in the given order and record their source mtimes.
+
+    Args:
+        module_names: Loaded modules to reload.
+        only_if_changed: Skip the reload when no module's source file was modified
+            since it was last reloaded. Only the ``stat`` of each file is checked.
+
+    Returns:
+        Whether the modules were reloaded.
+    """
+    if not module_names:
+        return False
+    if only_if_changed and not _sources_changed(module_names):
+        return False
+
+    started_ns = time.time_ns()
+    for module_name in module_names:
+        reload_module(module_name)
+        mtime = _source_mtime(module_name)
+        if started_ns - mtime > _MTIME_GRANULARITY_NS:
+            _reloaded_mtimes[module_name] = mtime
+        else:
+            _reloaded_mtimes.pop(module_name, None)
+    return True
+
+
+def reload_source_modules(
+    *,
+    extra_exclude_suffixes: list[str] | None = None,
+    only_if_changed: bool = False,
+) -> bool:
     """Reload all configured source modules and refresh the GooseApp.
 
     Collects modules from reload_targets, excludes those in reload_exclude,
@@ -103,26 +187,37 @@ def reload_source_modules(*, extra_exclude_suffixes: list[str] | None = None) ->
 
     Args:
         extra_exclude_suffixes: Additional module suffixes to exclude (e.g., [".conftest"]).
+        only_if_changed: Skip the reload when no module's source file was modified
+            since it was last reloaded. Only the ``stat`` of each file is checked.
+
+    Returns:
+        Whether any module was reloaded.
     """
     config = GooseConfig()
 
-    reload_exclude = config.compute_reload_exclude()
-    extra_suffixes = extra_exclude_suffixes or []
+    targets = set(config.reload_targets)
+    reload_exclude = set(config.compute_reload_exclude())
+    extra_suffixes = tuple(extra_exclude_suffixes or ())
 
+    # One pass over sys.modules for all targets, instead of one scan per target.
     modules = {
         mod
-        for target in config.reload_targets
-        for mod in collect_submodules(target)
-        if not any(mod == exc or mod.startswith(f"{exc}.") for exc in reload_exclude)
-        and not any(mod.endswith(suffix) for suffix in extra_suffixes)
+        for mod in list(sys.modules)
+        if _within_any(mod, targets)
+        and not _within_any(mod, reload_exclude)
+        and not (extra_suffixes and mod.endswith(extra_suffixes))
     }
 
-    if modules:
-        deps = _build_dependency_graph(modules)
-        for module_name in _topological_sort(modules, deps):
-            reload_module(module_name)
+    if not modules:
+        return False
+    if only_if_changed and not _sources_changed(modules):
+        return False
+
+    deps = _build_dependency_graph(modules)
+    reload_modules(_topological_sort(modules, deps))
 
-        config.refresh_app()
+    config.refresh_app()
+    return True
 
 
-__all__ = ["collect_submodules", "reload_module", "reload_source_modules"]
+__all__ = ["collect_submodules", "reload_module", "reload_modules", "reload_source_modules"]
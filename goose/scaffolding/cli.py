@@ -10,6 +10,9 @@ import typer
 # Template directory is located alongside this module
 TEMPLATE_DIR = Path(__file__).parent / "template"
 
+# Bytecode compiled from the template inside the installed package is not part of it.
+_TEMPLATE_IGNORE = shutil.ignore_patterns("__pycache__", "*.pyc")
+
 app = typer.Typer(help="Initialize Goose projects")
 
 
@@ -39,11 +42,17 @@ def init(
     if gooseapp_dir.exists() and force:
         shutil.rmtree(gooseapp_dir)
 
-    # Copy template directory
-    shutil.copytree(TEMPLATE_DIR, gooseapp_dir)
+    # Copy template directory, recording the copied files so they need not be walked again
+    copied: list[Path] = []
+
+    def copy_file(src: str, dst: str) -> str:
+        copied.append(Path(dst))
+        return shutil.copy2(src, dst)
+
+    shutil.copytree(TEMPLATE_DIR, gooseapp_dir, ignore=_TEMPLATE_IGNORE, copy_function=copy_file)
 
     typer.echo(f"Created {gooseapp_dir}/")
-    for file_path in sorted(gooseapp_dir.rglob("*.py")):
+    for file_path in sorted(path for path in copied if path.suffix == ".py"):
         relative = file_path.relative_to(gooseapp_dir)
         typer.echo(f"  ├── {relative}")
 
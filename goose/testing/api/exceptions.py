@@ -4,34 +4,33 @@ from __future__ import annotations
 
 import traceback
 
+import orjson
 from fastapi import FastAPI, Request, status  # type: ignore[import-not-found]
-from fastapi.responses import JSONResponse  # type: ignore[import-not-found]
+from fastapi.responses import Response  # type: ignore[import-not-found]
 
 from goose.testing.exceptions import TestLoadError, UnknownTestError
 
 
+def _error_response(status_code: int, detail: str) -> Response:
+    """Build a JSON error body with a single ``orjson`` encode, skipping ``jsonable_encoder``."""
+    return Response(content=orjson.dumps({"detail": detail}), status_code=status_code, media_type="application/json")
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers on the FastAPI app."""
 
     @app.exception_handler(TestLoadError)
-    async def test_load_error_handler(_request: Request, exc: TestLoadError) -> JSONResponse:
+    async def test_load_error_handler(_request: Request, exc: TestLoadError) -> Response:
         """Handle test loading errors (syntax errors, missing imports, etc.)."""
-        cause = exc.__cause__
-        if cause is not None:
-            tb = traceback.format_exception(type(cause), cause, cause.__traceback__)
-            detail = f"{exc.message}:\n\n{''.join(tb)}"
-        else:
-            detail = exc.message
-        return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content={"detail": detail})
+        return _error_response(status.HTTP_422_UNPROCESSABLE_ENTITY, exc.detail)
 
     @app.exception_handler(UnknownTestError)
-    async def unknown_test_error_handler(_request: Request, exc: UnknownTestError) -> JSONResponse:
+    async def unknown_test_error_handler(_request: Request, exc: UnknownTestError) -> Response:
         """Handle requests for tests that don't exist."""
-        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+        return _error_response(status.HTTP_404_NOT_FOUND, str(exc))
 
     @app.exception_handler(Exception)
-    async def generic_exception_handler(_request: Request, exc: Exception) -> JSONResponse:
+    async def generic_exception_handler(_request: Request, exc: Exception) -> Response:
         """Handle any unhandled exceptions with detailed traceback."""
-        tb = traceback.format_exception(type(exc), exc, exc.__traceback__)
-        detail = "".join(tb)
-        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"detail": detail})
+        detail = "".join(traceback.format_exception(exc))
+        return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, detail)
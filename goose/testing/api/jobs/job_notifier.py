@@ -4,50 +4,198 @@ from __future__ import annotations
 
 import asyncio
 import threading
+import weakref
+from collections import deque
+from collections.abc import Callable
+from itertools import islice
 
+from goose.testing.api.jobs.enums import JobStatus
 from goose.testing.api.jobs.models import Job
 
+FLUSH_INTERVAL_SECONDS = 0.016
+RING_SIZE = 1024
 
-class JobNotifier:
-    """Simple pub/sub broker that fans out job updates to websocket clients."""
+_TERMINAL_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED})
+
+
+class BroadcastRing:
+    """Bounded, thread-safe log of serialized payloads shared by every subscriber.
 
-    def __init__(self) -> None:
-        self._subscribers: dict[asyncio.Queue[Job], asyncio.AbstractEventLoop] = {}
+    Each payload is stored once regardless of the number of subscribers.
+    Subscribers track their own read position as a sequence number; once the
+    oldest payloads are evicted, positions that point before them are stale.
+    """
+
+    def __init__(self, maxlen: int = RING_SIZE) -> None:
+        self._buffer: deque[bytes] = deque(maxlen=maxlen)
+        self._next_seq = 0
         self._lock = threading.Lock()
 
-    def subscribe(self) -> asyncio.Queue[Job]:
-        """Register a new subscriber queue tied to the current event loop."""
+    @property
+    def head(self) -> int:
+        """Sequence number the next appended payload will receive."""
 
-        loop = asyncio.get_running_loop()
-        queue: asyncio.Queue[Job] = asyncio.Queue()
         with self._lock:
-            self._subscribers[queue] = loop
-        return queue
+            return self._next_seq
 
-    def unsubscribe(self, queue: asyncio.Queue[Job]) -> None:
-        """Remove a subscriber queue."""
+    def extend(self, payloads: list[bytes]) -> None:
+        """Append *payloads* to the ring, evicting the oldest entries when full."""
 
         with self._lock:
-            self._subscribers.pop(queue, None)
+            self._buffer.extend(payloads)
+            self._next_seq += len(payloads)
+
+    def read_from(self, cursor: int) -> tuple[list[bytes] | None, int]:
+        """Return the payloads published since *cursor* and the new cursor.
+
+        The payload list is ``None`` when *cursor* points at entries that have
+        already been evicted, i.e. the reader fell too far behind.
+        """
+
+        with self._lock:
+            end = self._next_seq
+            oldest = end - len(self._buffer)
+            if cursor < oldest:
+                return None, end
+            return list(islice(self._buffer, cursor - oldest, None)), end
+
+
+class Subscription:
+    """Read cursor into a ``BroadcastRing`` bound to the subscriber's event loop."""
+
+    def __init__(self, ring: BroadcastRing, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._ring = ring
+        self._cursor = ring.head
+        self._wakeup = asyncio.Event()
+
+    async def receive(self) -> list[bytes] | None:
+        """Wait for payloads published since the last call.
+
+        Returns:
+            The new payloads in publish order, or ``None`` when the subscriber
+            fell behind the ring and must resynchronize from a full snapshot.
+        """
+
+        while True:
+            self._wakeup.clear()
+            payloads, self._cursor = self._ring.read_from(self._cursor)
+            if payloads is None or payloads:
+                return payloads
+            await self._wakeup.wait()
+
+    def wake(self) -> None:
+        """Signal the subscriber from any thread that new payloads are available."""
+
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._wakeup.set)
 
-    def publish(self, job: Job) -> None:
-        """Fan-out a job update to every subscriber."""
 
+class JobNotifier:
+    """Simple pub/sub broker that fans out job updates to websocket clients.
+
+    Snapshots are coalesced per job: only the latest snapshot of each job is
+    delivered when the pending buffer is flushed, at most once per
+    ``flush_interval``. Terminal snapshots flush the buffer immediately.
+    Flushed snapshots are serialized once with *encode* into a shared
+    ``BroadcastRing`` that every subscriber reads from.
+
+    Subscriptions are held weakly: a subscription stays registered for as
+    long as its owner keeps a reference to it, so a handler that exits
+    without unsubscribing does not leak.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[Job], bytes],
+        *,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        ring_size: int = RING_SIZE,
+    ) -> None:
+        self._encode = encode
+        self._ring = BroadcastRing(ring_size)
+        self._subscribers: weakref.WeakSet[Subscription] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        # Serializes whole flushes. Timer flushes run on the event loop while terminal
+        # flushes run on the publishing thread; without it a flush that took older
+        # snapshots could append them after a newer flush.
+        self._flush_lock = threading.Lock()
+        self._flush_interval = flush_interval
+        self._pending: dict[str, Job] = {}
+        # Loop the pending timer flush is scheduled on, or None when no flush is scheduled.
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether any websocket client is currently subscribed."""
+
+        return bool(self._subscribers)
+
+    def subscribe(self) -> Subscription:
+        """Register a new subscription tied to the current event loop.
+
+        The caller must keep a reference to the returned subscription for as
+        long as it wants to receive updates.
+        """
+
+        subscription = Subscription(self._ring, asyncio.get_running_loop())
         with self._lock:
-            subscribers = list(self._subscribers.items())
+            self._subscribers.add(subscription)
+        return subscription
 
-        for queue, loop in subscribers:
-            loop.call_soon_threadsafe(self._enqueue, queue, job)
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription before its owner releases it."""
 
-    @staticmethod
-    def _enqueue(queue: asyncio.Queue[Job], job: Job) -> None:
-        """Attempt to enqueue *job* for a subscriber, dropping if the loop is gone."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, job: Job) -> None:
+        """Record the latest snapshot of *job* and schedule a fan-out to every subscriber."""
+
+        with self._lock:
+            if not self._subscribers:
+                # New subscribers receive a full snapshot on connect, so nothing is lost.
+                return
+            self._pending[job.id] = job
+            terminal = job.status in _TERMINAL_STATUSES
+            if not terminal and self._flush_loop is not None and not self._flush_loop.is_closed():
+                return
+            loop = None
+            for subscription in self._subscribers:
+                if not subscription.loop.is_closed():
+                    loop = subscription.loop
+                    break
+            if not terminal and loop is not None:
+                self._flush_loop = loop
+
+        if terminal or loop is None:
+            self._flush()
+            return
 
         try:
-            queue.put_nowait(job)
-        except (asyncio.QueueFull, RuntimeError):
-            # Drop the update if the subscriber is overwhelmed or already disconnected.
-            pass
+            loop.call_soon_threadsafe(loop.call_later, self._flush_interval, self._flush)
+        except RuntimeError:
+            # The loop closed after it was picked; flush now so the snapshot is not stranded.
+            self._flush()
+
+    def _flush(self) -> None:
+        """Serialize all pending snapshots into the ring and wake every subscriber."""
+
+        with self._flush_lock:
+            with self._lock:
+                jobs = list(self._pending.values())
+                self._pending.clear()
+                self._flush_loop = None
+                subscribers = list(self._subscribers)
+
+            if not jobs:
+                return
+
+            # Encoding stays outside ``_lock`` so publishers are not held up by it.
+            self._ring.extend([self._encode(job) for job in jobs])
+
+        for subscription in subscribers:
+            subscription.wake()
 
 
-__all__ = ["JobNotifier"]
+__all__ = ["BroadcastRing", "JobNotifier", "Subscription"]
@@ -6,12 +6,16 @@ import queue
 import threading
 import traceback
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import groupby
 
 from goose.testing.api.jobs.enums import TestStatus
 from goose.testing.api.jobs.models import Job
 from goose.testing.api.jobs.state import JobStore
+from goose.testing.discovery import rebind_definition, reload_test_package
 from goose.testing.models.tests import TestDefinition, TestResult
-from goose.testing.runner import execute_test
+from goose.testing.runner import execute_tests
 
 
 class JobQueue:
@@ -21,12 +25,21 @@ class JobQueue:
         self,
         *,
         on_job_update: Callable[[Job], None] | None = None,
+        has_listeners: Callable[[], bool] | None = None,
         on_result_added: Callable[[str, TestResult], None] | None = None,
         job_store: JobStore = JobStore(),
+        max_concurrency: int = 1,
     ) -> None:
         self.job_store = job_store
+        self._max_concurrency = max_concurrency
+        # One pool for the queue's lifetime, so worker threads are reused across jobs instead of
+        # being started and joined for every package. Threads are only spawned once tests are submitted.
+        self._pool: ThreadPoolExecutor | None = None
+        if max_concurrency > 1:
+            self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="GooseTestWorker")
         self._queue: queue.Queue[tuple[str, list[TestDefinition]]] = queue.Queue()
         self._on_job_update = on_job_update
+        self._has_listeners = has_listeners
         self._on_result_added = on_result_added
         threading.Thread(target=self._worker_loop, daemon=True, name="GooseJobWorker").start()
 
@@ -39,25 +52,43 @@ class JobQueue:
         return job
 
     def _execute_targets(self, job_id: str, targets: list[TestDefinition]) -> list[TestResult]:
-        """Run the provided tests sequentially, updating per-test status."""
-
-        results: list[TestResult] = []
-        for definition in targets:
-            qualified_name = definition.qualified_name
-            running_snapshot = self.job_store.update_test_status(job_id, qualified_name, TestStatus.RUNNING)
-            self._notify(running_snapshot)
-
-            result = execute_test(definition)
-            results.append(result)
-            # Add result to job immediately so frontend can show details
-            snapshot = self.job_store.add_test_result(job_id, result)
-            self._notify(snapshot)
-
-            # Notify that a result was added (for persistence)
-            if self._on_result_added is not None:
-                self._on_result_added(job_id, result)
-
-        return results
+        """Run the provided tests, updating per-test status.
+
+        Up to ``max_concurrency`` tests of the same package run at a time.
+        Packages are hot-reloaded one after another, never while tests are
+        running. Results are returned in target order.
+        """
+
+        completed: dict[int, TestResult] = {}
+        offset = 0
+        for root_package, group in groupby(targets, key=lambda target: target.module.partition(".")[0]):
+            # Hot-reload once per package instead of once per test.
+            reload_test_package(root_package)
+            definitions = [rebind_definition(target) for target in group]
+
+            def mark_running(index: int, offset: int = offset) -> None:
+                running_snapshot = self.job_store.update_test_status(
+                    job_id, offset + index, TestStatus.RUNNING, snapshot=self._wants_updates()
+                )
+                self._notify(running_snapshot)
+
+            results = execute_tests(definitions, jobs=self._max_concurrency, on_start=mark_running, pool=self._pool)
+            with closing(results):
+                for index, result in results:
+                    completed[offset + index] = result
+                    # Add result to job immediately so frontend can show details
+                    snapshot = self.job_store.add_test_result(
+                        job_id, offset + index, result, snapshot=self._wants_updates()
+                    )
+                    self._notify(snapshot)
+
+                    # Notify that a result was added (for persistence)
+                    if self._on_result_added is not None:
+                        self._on_result_added(job_id, result)
+
+            offset += len(definitions)
+
+        return [completed[index] for index in range(len(targets))]
 
     def list_jobs(self) -> list[Job]:
         """Return a snapshot of all known jobs."""
@@ -69,12 +100,22 @@ class JobQueue:
 
         return self.job_store.get_job(job_id)
 
+    def _wants_updates(self) -> bool:
+        """Return whether job snapshots currently have anyone to be delivered to."""
+
+        if self._on_job_update is None:
+            return False
+        if self._has_listeners is None:
+            return True
+        return self._has_listeners()
+
     def _notify(self, job: Job | None) -> None:
         """Invoke the configured callback with the latest job snapshot."""
 
-        if job is None or self._on_job_update is None:
+        callback = self._on_job_update
+        if job is None or callback is None or not self._wants_updates():
             return
-        self._on_job_update(job)
+        callback(job)
 
     def _run_job(self, job_id: str, targets: list[TestDefinition]) -> Job | None:
         """Execute a queued job and update observers."""
@@ -90,8 +131,9 @@ class JobQueue:
             self._notify(final_job)
             return final_job
         except Exception as exc:  # pylint: disable=broad-except
-            error_message = "\n".join(traceback.format_exception(exc))
-            failed_job = self.job_store.mark_failed(job_id, error_message)
+            # Source lines are read now: a hot reload may rewrite the files before the error is rendered.
+            error = traceback.TracebackException.from_exception(exc)
+            failed_job = self.job_store.mark_failed(job_id, error)
             self._notify(failed_job)
             return failed_job
 
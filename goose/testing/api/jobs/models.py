@@ -2,12 +2,40 @@
 
 from __future__ import annotations
 
+import traceback
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from goose.testing.api.jobs.enums import JobStatus, TestStatus
 from goose.testing.models.tests import TestDefinition, TestResult
 
+# Per-test statuses are packed one byte per target; each byte indexes this tuple.
+# QUEUED comes first, so a zero-filled bytearray marks every test as queued.
+TEST_STATUS_BY_CODE: tuple[TestStatus, ...] = tuple(TestStatus)
+TEST_STATUS_CODES: dict[TestStatus, int] = {status: code for code, status in enumerate(TEST_STATUS_BY_CODE)}
+
+
+class JobError:
+    """Failure captured from a job run, rendered as text on first use.
+
+    Every snapshot of a failed job shares this object, so the traceback is
+    formatted once rather than on each snapshot, listing and broadcast.
+    """
+
+    __slots__ = ("exception", "_text")
+
+    def __init__(self, exception: traceback.TracebackException) -> None:
+        self.exception = exception
+        self._text: str | None = None
+
+    @property
+    def text(self) -> str:
+        """The formatted traceback."""
+
+        if self._text is None:
+            self._text = "".join(self.exception.format())
+        return self._text
+
 
 @dataclass(slots=True)
 # Dataclass captures all job metadata needed for orchestration.
@@ -21,8 +49,17 @@ class Job:
     created_at: datetime
     updated_at: datetime
     results: list[TestResult] = field(default_factory=list)
-    error: str | None = None
-    test_statuses: dict[str, TestStatus] = field(default_factory=dict)
+    error: JobError | None = None
+    status_codes: bytearray = field(default_factory=bytearray)
+
+    @property
+    def test_statuses(self) -> dict[str, TestStatus]:
+        """Per-test statuses keyed by qualified name, decoded from ``status_codes``."""
+
+        return {
+            target.qualified_name: TEST_STATUS_BY_CODE[code]
+            for target, code in zip(self.targets, self.status_codes)
+        }
 
 
-__all__ = ["Job"]
+__all__ = ["Job", "JobError", "TEST_STATUS_BY_CODE", "TEST_STATUS_CODES"]
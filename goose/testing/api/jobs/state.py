@@ -2,16 +2,47 @@
 
 from __future__ import annotations
 
-import copy
+import dataclasses
 import threading
+import traceback
 import uuid
 from datetime import datetime, timezone
 
 from goose.testing.api.jobs.enums import JobStatus, TestStatus
-from goose.testing.api.jobs.models import Job
+from goose.testing.api.jobs.models import TEST_STATUS_CODES, Job, JobError
 from goose.testing.models.tests import TestDefinition, TestResult
 
 
+def _snapshot(job: Job) -> Job:
+    """Return a copy of *job* that is safe to hand out of the store.
+
+    Only the mutable containers are copied. Test definitions and results are
+    never mutated once stored, so snapshots share them instead of deep-copying
+    every target and result on each status update.
+    """
+
+    return dataclasses.replace(
+        job,
+        targets=list(job.targets),
+        results=list(job.results),
+        status_codes=bytearray(job.status_codes),
+    )
+
+
+def _fill(status: TestStatus, count: int) -> bytearray:
+    """Return packed status codes marking *count* tests with *status*."""
+
+    return bytearray((TEST_STATUS_CODES[status],)) * count
+
+
+def _result_code(result: TestResult) -> int:
+    """Return the packed status code for a finished test."""
+
+    if result.passed:
+        return TEST_STATUS_CODES[TestStatus.PASSED]
+    return TEST_STATUS_CODES[TestStatus.FAILED]
+
+
 class JobStore:
     """Thread-safe storage for job metadata."""
 
@@ -30,26 +61,28 @@ class JobStore:
             targets=list(targets),
             created_at=now,
             updated_at=now,
-            test_statuses={target.qualified_name: TestStatus.QUEUED for target in targets},
+            status_codes=_fill(TestStatus.QUEUED, len(targets)),
         )
         with self._lock:
             self._jobs[job_id] = job
-        return copy.deepcopy(job)
+        return _snapshot(job)
 
     def get_job(self, job_id: str) -> Job | None:
         """Return a copy of a stored job by identifier."""
 
         with self._lock:
             job = self._jobs.get(job_id)
-            return copy.deepcopy(job) if job is not None else None
+            if job is None:
+                return None
+            return _snapshot(job)
 
     def list_jobs(self) -> list[Job]:
         """Return all known jobs sorted by creation time descending."""
 
+        # Jobs are only ever inserted by create_job, so dict order is creation order.
         with self._lock:
-            jobs = list(self._jobs.values())
-        jobs.sort(key=lambda item: item.created_at, reverse=True)
-        return [copy.deepcopy(item) for item in jobs]
+            jobs = list(reversed(self._jobs.values()))
+        return [_snapshot(item) for item in jobs]
 
     def mark_running(self, job_id: str) -> Job | None:
         """Transition a job to the running state."""
@@ -62,10 +95,10 @@ class JobStore:
             job.updated_at = datetime.now(timezone.utc)
             job.results.clear()
             job.error = None
-            job.test_statuses = {target.qualified_name: TestStatus.QUEUED for target in job.targets}
+            job.status_codes = _fill(TestStatus.QUEUED, len(job.targets))
             if job.targets:
-                job.test_statuses[job.targets[0].qualified_name] = TestStatus.RUNNING
-            return copy.deepcopy(job)
+                job.status_codes[0] = TEST_STATUS_CODES[TestStatus.RUNNING]
+            return _snapshot(job)
 
     def mark_succeeded(self, job_id: str, results: list[TestResult]) -> Job | None:
         """Persist successful completion details for a job."""
@@ -79,16 +112,16 @@ class JobStore:
             job.results = list(results)
             job.error = None
             if results:
-                job.test_statuses = {
-                    result.definition.qualified_name: (TestStatus.PASSED if result.passed else TestStatus.FAILED)
-                    for result in results
-                }
+                job.status_codes = bytearray(_result_code(result) for result in results)
             else:
-                job.test_statuses = {target.qualified_name: TestStatus.PASSED for target in job.targets}
-            return copy.deepcopy(job)
+                job.status_codes = _fill(TestStatus.PASSED, len(job.targets))
+            return _snapshot(job)
+
+    def mark_failed(self, job_id: str, error: traceback.TracebackException) -> Job | None:
+        """Persist the captured failure for a job.
 
-    def mark_failed(self, job_id: str, message: str) -> Job | None:
-        """Persist a failure message for a job."""
+        The traceback is stored unformatted; it is rendered once, when the job is first serialized.
+        """
 
         with self._lock:
             job = self._jobs.get(job_id)
@@ -96,34 +129,45 @@ class JobStore:
                 return None
             job.status = JobStatus.FAILED
             job.updated_at = datetime.now(timezone.utc)
-            job.error = message
+            job.error = JobError(error)
             job.results.clear()
-            job.test_statuses = {target.qualified_name: TestStatus.FAILED for target in job.targets}
-            return copy.deepcopy(job)
+            job.status_codes = _fill(TestStatus.FAILED, len(job.targets))
+            return _snapshot(job)
 
-    def update_test_status(self, job_id: str, test_name: str, status: TestStatus) -> Job | None:
-        """Update the status of a specific test in a job."""
+    def update_test_status(self, job_id: str, index: int, status: TestStatus, *, snapshot: bool = True) -> Job | None:
+        """Update the status of the test at position *index* in the job's targets.
+
+        Pass ``snapshot=False`` when the caller has no use for the returned
+        copy; ``None`` is returned instead.
+        """
 
         with self._lock:
             job = self._jobs.get(job_id)
             if job is None:
                 return None
-            job.test_statuses[test_name] = status
+            job.status_codes[index] = TEST_STATUS_CODES[status]
             job.updated_at = datetime.now(timezone.utc)
-            return copy.deepcopy(job)
+            if not snapshot:
+                return None
+            return _snapshot(job)
 
-    def add_test_result(self, job_id: str, result: TestResult) -> Job | None:
-        """Add a completed test result to a job and update its status."""
+    def add_test_result(self, job_id: str, index: int, result: TestResult, *, snapshot: bool = True) -> Job | None:
+        """Add the result of the test at position *index* to a job and update its status.
+
+        Pass ``snapshot=False`` when the caller has no use for the returned
+        copy; ``None`` is returned instead.
+        """
 
         with self._lock:
             job = self._jobs.get(job_id)
             if job is None:
                 return None
             job.results.append(result)
-            status = TestStatus.PASSED if result.passed else TestStatus.FAILED
-            job.test_statuses[result.definition.qualified_name] = status
+            job.status_codes[index] = _result_code(result)
             job.updated_at = datetime.now(timezone.utc)
-            return copy.deepcopy(job)
+            if not snapshot:
+                return None
+            return _snapshot(job)
 
 
 __all__ = ["JobStore"]
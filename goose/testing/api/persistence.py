@@ -11,10 +11,12 @@ This provides fast startup (only reads latest.json) and efficient writes
 from __future__ import annotations
 
 import json
+import os
 import re
 import shutil
 import threading
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -46,6 +48,10 @@ class LatestIndex(BaseModel):
     latest: dict[str, StoredRun] = Field(default_factory=dict)
 
 
+# Sort key for stored runs; a C-level getter instead of a Python lambda call per run.
+_RUN_TIMESTAMP = attrgetter("timestamp")
+
+
 def _sanitize_filename(qualified_name: str) -> str:
     """Convert a qualified test name to a safe filename.
 
@@ -86,6 +92,8 @@ class TestRunStore:
         self._history_path = data_path / "history"
         self._lock = threading.Lock()
         self._index: LatestIndex = self._load_index()
+        # Parsed history files keyed by path, with the (mtime_ns, size) they were parsed at.
+        self._history_cache: dict[Path, tuple[tuple[int, int], TestRunHistory]] = {}
 
     def _load_index(self) -> LatestIndex:
         """Load the latest index from disk."""
@@ -111,16 +119,52 @@ class TestRunStore:
 
     def _load_test_history(self, qualified_name: str) -> TestRunHistory:
         """Load history for a specific test."""
-        history_file = self._get_history_file(qualified_name)
-        if not history_file.exists():
+        history = self._read_history_file(self._get_history_file(qualified_name))
+        if history is None:
             return TestRunHistory()
+        return history
 
+    def _read_history_file(self, history_file: Path) -> TestRunHistory | None:
+        """Return the parsed history in *history_file*, or ``None`` if it is missing or invalid.
+
+        A file is only parsed again once its modification time or size
+        changes, e.g. after another goose process wrote to it. Callers get
+        their own ``runs`` list, so mutating it leaves the cache intact.
+        """
         try:
-            with open(history_file, encoding="utf-8") as f:
-                data = json.load(f)
-            return TestRunHistory.model_validate(data)
-        except (json.JSONDecodeError, ValueError):
-            return TestRunHistory()
+            stat = history_file.stat()
+        except FileNotFoundError:
+            self._history_cache.pop(history_file, None)
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._history_cache.get(history_file)
+        if cached is None or cached[0] != signature:
+            try:
+                with open(history_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                history = TestRunHistory.model_validate(data)
+            except (json.JSONDecodeError, ValueError):
+                return None
+            cached = (signature, history)
+            self._history_cache[history_file] = cached
+
+        return TestRunHistory.model_construct(runs=list(cached[1].runs))
+
+    def _history_files(self) -> list[Path]:
+        """Return the per-test history files, or an empty list if none were written yet.
+
+        One directory scan replaces an existence check followed by a glob.
+        """
+        try:
+            with os.scandir(self._history_path) as entries:
+                return [
+                    self._history_path / entry.name
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
 
     def _save_test_history(self, qualified_name: str, history: TestRunHistory) -> None:
         """Persist history for a specific test."""
@@ -128,6 +172,10 @@ class TestRunStore:
         history_file = self._get_history_file(qualified_name)
         with open(history_file, "w", encoding="utf-8") as f:
             json.dump(history.model_dump(mode="json"), f, indent=2, default=str)
+        # What was just written is already parsed; remember it instead of re-reading the file.
+        stat = history_file.stat()
+        saved = TestRunHistory.model_construct(runs=list(history.runs))
+        self._history_cache[history_file] = ((stat.st_mtime_ns, stat.st_size), saved)
 
     def add_run(self, job_id: str, result: TestResultModel) -> None:
         """Add a new test run to the history.
@@ -177,19 +225,12 @@ class TestRunStore:
         all_runs: list[StoredRun] = []
 
         with self._lock:
-            if not self._history_path.exists():
-                return []
-
-            for history_file in self._history_path.glob("*.json"):
-                try:
-                    with open(history_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    history = TestRunHistory.model_validate(data)
+            for history_file in self._history_files():
+                history = self._read_history_file(history_file)
+                if history is not None:
                     all_runs.extend(history.runs)
-                except (json.JSONDecodeError, ValueError):
-                    continue
 
-        all_runs.sort(key=lambda r: r.timestamp)
+        all_runs.sort(key=_RUN_TIMESTAMP)
         return all_runs
 
     def get_runs_for_test(self, qualified_name: str) -> list[StoredRun]:
@@ -207,13 +248,14 @@ class TestRunStore:
             history = self._load_test_history(qualified_name)
 
         runs = list(history.runs)
-        runs.sort(key=lambda r: r.timestamp)
+        runs.sort(key=_RUN_TIMESTAMP)
         return runs
 
     def clear(self) -> None:
         """Delete all stored test run history."""
         with self._lock:
             self._index = LatestIndex()
+            self._history_cache.clear()
 
             # Delete index file
             if self._index_path.exists():
@@ -253,7 +295,7 @@ class TestRunStore:
         with self._lock:
             history = self._load_test_history(qualified_name)
             runs = list(history.runs)
-            runs.sort(key=lambda r: r.timestamp)
+            runs.sort(key=_RUN_TIMESTAMP)
 
             if index < 0 or index >= len(runs):
                 return False
@@ -277,7 +319,7 @@ class TestRunStore:
                 # Update index if we deleted the latest run
                 if self._index.latest.get(qualified_name) == deleted_run:
                     # Find new latest
-                    new_latest = max(runs, key=lambda r: r.timestamp)
+                    new_latest = max(runs, key=_RUN_TIMESTAMP)
                     self._index.latest[qualified_name] = new_latest
                     self._save_index()
 
@@ -291,17 +333,10 @@ class TestRunStore:
         count = 0
 
         with self._lock:
-            if not self._history_path.exists():
-                return 0
-
-            for history_file in self._history_path.glob("*.json"):
-                try:
-                    with open(history_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    history = TestRunHistory.model_validate(data)
+            for history_file in self._history_files():
+                history = self._read_history_file(history_file)
+                if history is not None:
                     count += len(history.runs)
-                except (json.JSONDecodeError, ValueError):
-                    continue
 
         return count
 
@@ -1,21 +1,41 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, status  # type: ignore[import-not-found]
+from fastapi import APIRouter, HTTPException, Response, WebSocket, WebSocketDisconnect, status  # type: ignore[import-not-found]
 
 from goose.core.config import GooseConfig
-from goose.testing.api.jobs import JobNotifier, JobQueue
+from goose.testing.api.jobs import Job, JobNotifier, JobQueue
 from goose.testing.api.jobs.job_target_resolver import resolve_targets
 from goose.testing.api.persistence import TestRunStore
-from goose.testing.api.schema import JobResource, RunRequest, TestResultModel, TestSummary
+from goose.testing.api.schema import (
+    JobResource,
+    RunRequest,
+    TestResultModel,
+    TestSummary,
+    job_to_json_bytes,
+    jobs_to_json_bytes,
+    result_map_to_json_bytes,
+    results_to_json_bytes,
+    summaries_to_json_bytes,
+)
 from goose.testing.discovery import load_from_qualified_name
 from goose.testing.models.tests import TestResult
 
 router = APIRouter()
 
-notifier = JobNotifier()
+
+def _job_event(job: Job) -> bytes:
+    """Encode a single job update as a websocket event."""
+    return b'{"type":"job","job":' + job_to_json_bytes(job) + b"}"
+
+
+def _snapshot_event(jobs: list[Job]) -> bytes:
+    """Encode the full job list as a websocket snapshot event."""
+    return b'{"type":"snapshot","jobs":' + jobs_to_json_bytes(jobs) + b"}"
+
+
+notifier = JobNotifier(_job_event)
 
 
 def _get_data_path() -> Path:
@@ -33,41 +53,52 @@ def _on_result_added(job_id: str, result: TestResult) -> None:
     test_run_store.add_run(job_id, result_model)
 
 
-job_queue = JobQueue(on_job_update=notifier.publish, on_result_added=_on_result_added)
+job_queue = JobQueue(
+    on_job_update=notifier.publish,
+    has_listeners=lambda: notifier.has_subscribers,
+    on_result_added=_on_result_added,
+    max_concurrency=GooseConfig().max_concurrency,
+)
+
+
+def _json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """Wrap pre-serialized JSON bytes in a response, bypassing response-model validation."""
+    return Response(content=content, status_code=status_code, media_type="application/json")
 
 
 @router.get("/tests", response_model=list[TestSummary])
-def get_tests() -> list[TestSummary]:
+def get_tests() -> Response:
     """Return metadata for all discovered Goose tests."""
     definitions = load_from_qualified_name(GooseConfig.TESTS_MODULE)
-    return [TestSummary.from_definition(definition) for definition in definitions]
+    summaries = [TestSummary.from_definition(definition) for definition in definitions]
+    return _json_response(summaries_to_json_bytes(summaries))
 
 
 @router.post("/runs", response_model=JobResource, status_code=status.HTTP_202_ACCEPTED)
-def create_run(payload: RunRequest | None = None) -> JobResource:
+def create_run(payload: RunRequest | None = None) -> Response:
     """Schedule execution for all tests or a targeted subset."""
     request = payload or RunRequest()
     targets = resolve_targets(request.tests)
     job = job_queue.enqueue(targets)
-    return JobResource.from_job(job)
+    return _json_response(job_to_json_bytes(job), status_code=status.HTTP_202_ACCEPTED)
 
 
 @router.get("/runs", response_model=list[JobResource])
-def list_runs() -> list[JobResource]:
+def list_runs() -> Response:
     """Return snapshots for all known execution jobs."""
 
     jobs = job_queue.list_jobs()
-    return [JobResource.from_job(job) for job in jobs]
+    return _json_response(jobs_to_json_bytes(jobs))
 
 
 @router.get("/runs/{job_id}", response_model=JobResource)
-def get_run(job_id: str) -> JobResource:
+def get_run(job_id: str) -> Response:
     """Return status details for a single execution job."""
 
     job = job_queue.get_job(job_id)
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-    return JobResource.from_job(job)
+    return _json_response(job_to_json_bytes(job))
 
 
 @router.websocket("/ws/runs")
@@ -75,36 +106,37 @@ async def runs_stream(websocket: WebSocket) -> None:
     """Stream job updates to connected clients."""
 
     await websocket.accept()
-    queue = notifier.subscribe()
+    # The notifier only holds subscriptions weakly; this reference keeps it alive for the connection,
+    # and the explicit unsubscribe below drops it as soon as the connection ends.
+    subscription = notifier.subscribe()
     try:
-        snapshot = job_queue.list_jobs()
-        payload = {
-            "type": "snapshot",
-            "jobs": [JobResource.from_job(job).model_dump(mode="json") for job in snapshot],
-        }
-        await websocket.send_text(json.dumps(payload))
+        await websocket.send_bytes(_snapshot_event(job_queue.list_jobs()))
 
         while True:
-            job_snapshot = await queue.get()
-            job_resource = JobResource.from_job(job_snapshot)
-            await websocket.send_text(json.dumps({"type": "job", "job": job_resource.model_dump(mode="json")}))
+            payloads = await subscription.receive()
+            if payloads is None:
+                # Fell behind the broadcast ring; resynchronize with a fresh snapshot.
+                await websocket.send_bytes(_snapshot_event(job_queue.list_jobs()))
+                continue
+            for payload in payloads:
+                await websocket.send_bytes(payload)
     except WebSocketDisconnect:
         pass
     finally:
-        notifier.unsubscribe(queue)
+        notifier.unsubscribe(subscription)
 
 
 @router.get("/history", response_model=dict[str, TestResultModel])
-def get_history() -> dict[str, TestResultModel]:
+def get_history() -> Response:
     """Return the latest result for each test from persisted history."""
-    return test_run_store.get_latest_results()
+    return _json_response(result_map_to_json_bytes(test_run_store.get_latest_results()))
 
 
 @router.get("/history/{qualified_name:path}", response_model=list[TestResultModel])
-def get_test_history(qualified_name: str) -> list[TestResultModel]:
+def get_test_history(qualified_name: str) -> Response:
     """Return all historical results for a specific test, oldest first."""
     runs = test_run_store.get_runs_for_test(qualified_name)
-    return [run.result for run in runs]
+    return _json_response(results_to_json_bytes([run.result for run in runs]))
 
 
 @router.delete("/history", status_code=status.HTTP_204_NO_CONTENT)
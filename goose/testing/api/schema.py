@@ -14,10 +14,12 @@ backend and the frontend UI.
 from __future__ import annotations
 
 import inspect
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from goose.testing.api.jobs import Job, JobStatus, TestStatus
 from goose.testing.errors import ErrorType
@@ -33,7 +35,9 @@ def _first_line(text: str | None) -> str | None:
 
     if not text:
         return None
-    return text.strip().splitlines()[0]
+    # Partition at the first newline instead of splitting every line of the docstring.
+    head, _, _ = text.strip().partition("\n")
+    return head.rstrip("\r")
 
 
 class TestSummary(BaseModel):
@@ -51,7 +55,8 @@ class TestSummary(BaseModel):
     name: str
     docstring: str | None = Field(default=None, description="First line of the test docstring, if present")
 
-    model_config = ConfigDict(populate_by_name=True)
+    # Frozen because ``from_definition`` hands the same cached instance to every caller.
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     @classmethod
     def from_definition(cls, definition: TestDefinition) -> TestSummary:
@@ -65,13 +70,25 @@ class TestSummary(BaseModel):
             test function's docstring (if present).
         """
 
+        cached = _SUMMARY_CACHE.get(definition.qualified_name)
+        if cached is not None and cached[0] is definition.func:
+            return cached[1]
+
         docstring = inspect.getdoc(definition.func)
-        return cls(
+        summary = cls.model_construct(
             qualified_name=definition.qualified_name,
             module=definition.module,
             name=definition.name,
             docstring=_first_line(docstring),
         )
+        _SUMMARY_CACHE[definition.qualified_name] = (definition.func, summary)
+        return summary
+
+
+# Summaries keyed by qualified name, together with the function they were built
+# from. Hot reload replaces test functions, so an entry only hits while the
+# function object is unchanged and needs no explicit invalidation.
+_SUMMARY_CACHE: dict[str, tuple[Callable[..., Any], TestSummary]] = {}
 
 
 class TestResultModel(BaseModel):
@@ -99,6 +116,9 @@ class TestResultModel(BaseModel):
     expected_tool_calls: list[str] = Field(default_factory=list)
     response: dict[str, Any] | None = None
 
+    # Also parses persisted run history, which may hold fields written by another goose version.
+    model_config = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
+
     @classmethod
     def from_result(cls, result: TestResult) -> TestResultModel:
         """Convert an internal ``TestResult`` into the API model.
@@ -108,36 +128,49 @@ class TestResultModel(BaseModel):
         present a self-contained result object.
         """
 
-        definition = result.definition
-        test_case = result.test_case
-        query: str | None = None
-        expectations: list[str] = []
-        expected_tool_calls: list[str] = []
-        response_payload: dict[str, Any] | None = None
-
-        if test_case is not None:
-            query = test_case.query_message
-            expectations = list(test_case.expectations)
-            expected_tool_calls = test_case.expected_tool_call_names
-            if test_case.last_response is not None:
-                response_payload = test_case.last_response.model_dump(mode="json")
-
-        return cls(
-            qualified_name=definition.qualified_name,
-            module=definition.module,
-            name=definition.name,
-            passed=result.passed,
-            duration=result.duration,
-            total_tokens=result.total_tokens,
-            error=result.error_message,
-            error_type=result.error_type,
-            expectations_unmet=list(result.expectations_unmet),
-            failure_reasons=dict(result.failure_reasons),
-            query=query,
-            expectations=expectations,
-            expected_tool_calls=expected_tool_calls,
-            response=response_payload,
-        )
+        # Fields come from an already-validated internal result; skip re-validation.
+        return cls.model_construct(**_result_fields(result))
+
+
+def _result_fields(result: TestResult) -> dict[str, Any]:
+    """Map a ``TestResult`` onto the ``TestResultModel`` fields as plain data.
+
+    Shared by ``TestResultModel.from_result`` and the hand-written job
+    serializer so both views always expose the same fields. Lists and dicts
+    are shared with the result rather than copied; stored results are never
+    mutated.
+    """
+
+    definition = result.definition
+    test_case = result.test_case
+    query: str | None = None
+    expectations: list[str] = []
+    expected_tool_calls: list[str] = []
+    response_payload: dict[str, Any] | None = None
+
+    if test_case is not None:
+        query = test_case.query_message
+        expectations = test_case.expectations
+        expected_tool_calls = test_case.expected_tool_call_names
+        if test_case.last_response is not None:
+            response_payload = test_case.last_response.model_dump(mode="json")
+
+    return {
+        "qualified_name": definition.qualified_name,
+        "module": definition.module,
+        "name": definition.name,
+        "passed": result.passed,
+        "duration": result.duration,
+        "total_tokens": result.total_tokens,
+        "error": result.error_message,
+        "error_type": result.error_type,
+        "expectations_unmet": result.expectations_unmet,
+        "failure_reasons": result.failure_reasons,
+        "query": query,
+        "expectations": expectations,
+        "expected_tool_calls": expected_tool_calls,
+        "response": response_payload,
+    }
 
 
 class JobResource(BaseModel):
@@ -158,7 +191,7 @@ class JobResource(BaseModel):
     results: list[TestResultModel] = Field(default_factory=list)
     test_statuses: dict[str, TestStatus] = Field(default_factory=dict)
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, use_enum_values=True)
 
     @classmethod
     def from_job(cls, job: Job) -> JobResource:
@@ -169,16 +202,70 @@ class JobResource(BaseModel):
         updates.
         """
 
-        return cls(
-            id=job.id,
-            status=job.status,
-            tests=[target.qualified_name for target in job.targets],
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            error=job.error,
-            results=[TestResultModel.from_result(result) for result in job.results],
-            test_statuses=job.test_statuses,
-        )
+        # Fields come from a store snapshot; skip re-validation of trusted internal data.
+        fields = _job_fields(job)
+        fields["results"] = [TestResultModel.model_construct(**result) for result in fields["results"]]
+        return cls.model_construct(**fields)
+
+
+def _job_fields(job: Job) -> dict[str, Any]:
+    """Map a ``Job`` onto the ``JobResource`` fields as plain data."""
+
+    error: str | None = None
+    if job.error is not None:
+        error = job.error.text
+
+    return {
+        "id": job.id,
+        "status": job.status,
+        "tests": [target.qualified_name for target in job.targets],
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+        "error": error,
+        "results": [_result_fields(result) for result in job.results],
+        "test_statuses": job.test_statuses,
+    }
+
+
+def job_to_json_bytes(job: Job) -> bytes:
+    """Serialize a ``Job`` snapshot to ``JobResource``-shaped JSON without building Pydantic models.
+
+    Job snapshots come from the job store and are already well-formed, so
+    validation is skipped and the payload is encoded by ``orjson`` in one pass.
+    """
+
+    return orjson.dumps(_job_fields(job), option=orjson.OPT_UTC_Z)
+
+
+def jobs_to_json_bytes(jobs: list[Job]) -> bytes:
+    """Serialize several ``Job`` snapshots to a JSON array, see ``job_to_json_bytes``."""
+
+    return orjson.dumps([_job_fields(job) for job in jobs], option=orjson.OPT_UTC_Z)
+
+
+# Reusable adapters so list/dict payloads are serialized by pydantic-core in one
+# pass, without FastAPI re-validating every item against the response model.
+_SUMMARY_LIST_ADAPTER: TypeAdapter[list[TestSummary]] = TypeAdapter(list[TestSummary])
+_RESULT_LIST_ADAPTER: TypeAdapter[list[TestResultModel]] = TypeAdapter(list[TestResultModel])
+_RESULT_MAP_ADAPTER: TypeAdapter[dict[str, TestResultModel]] = TypeAdapter(dict[str, TestResultModel])
+
+
+def summaries_to_json_bytes(summaries: list[TestSummary]) -> bytes:
+    """Serialize test summaries to a JSON array."""
+
+    return _SUMMARY_LIST_ADAPTER.dump_json(summaries)
+
+
+def results_to_json_bytes(results: list[TestResultModel]) -> bytes:
+    """Serialize test results to a JSON array."""
+
+    return _RESULT_LIST_ADAPTER.dump_json(results)
+
+
+def result_map_to_json_bytes(results: dict[str, TestResultModel]) -> bytes:
+    """Serialize a mapping of qualified test name to result as a JSON object."""
+
+    return _RESULT_MAP_ADAPTER.dump_json(results)
 
 
 class RunRequest(BaseModel):
@@ -201,4 +288,9 @@ __all__ = [
     "RunRequest",
     "TestResultModel",
     "TestSummary",
+    "job_to_json_bytes",
+    "jobs_to_json_bytes",
+    "result_map_to_json_bytes",
+    "results_to_json_bytes",
+    "summaries_to_json_bytes",
 ]
@@ -6,22 +6,22 @@ and listing Goose tests from the command line.
 
 from __future__ import annotations
 
+# pylint: disable=import-outside-toplevel
+
+from enum import Enum
+
 import typer
-from typer import colors
 
 from goose.core.config import GooseConfig
-from goose.testing.api.persistence import TestRunStore
-from goose.testing.discovery import load_from_qualified_name
-from goose.testing.output import run_tests
 
 app = typer.Typer(help="Run and manage Goose tests")
 
 
-def _get_store() -> TestRunStore:
-    """Return a TestRunStore using the standard gooseapp/data/ path."""
-    config = GooseConfig()
-    data_path = config.gooseapp_dir / "data"
-    return TestRunStore(data_path)
+class OutputFormat(str, Enum):
+    """How ``goose test run`` reports results on stdout."""
+
+    TEXT = "text"
+    JSON = "json"
 
 
 @app.command()
@@ -36,12 +36,38 @@ def run(
         "--verbose",
         help="Display conversational transcripts including human prompts, agent replies, and tool activity",
     ),
+    jobs: int = typer.Option(
+        1,
+        "-j",
+        "--jobs",
+        "--concurrency",
+        envvar="GOOSE_MAX_CONCURRENCY",
+        min=1,
+        help="Number of tests to run concurrently. Only raise this if your fixtures and hooks are thread-safe.",
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.TEXT,
+        "--output",
+        case_sensitive=False,
+        help="Report format: 'text' for the colored report, 'json' for one JSON record per result and no summary line",
+    ),
+    exitfirst: bool = typer.Option(
+        False,
+        "-x",
+        "--exitfirst",
+        help="Stop after the first failing test",
+    ),
 ) -> None:
     """Run Goose tests from the command line.
 
     Uses the fixed gooseapp/ structure. If no target is specified,
     runs all tests in gooseapp.tests.
     """
+    # Discovery and the runner pull in the agent stack; load them only when a command runs.
+    from goose.testing.api.persistence import TestRunStore
+    from goose.testing.discovery import load_from_qualified_name
+    from goose.testing.output import display_summary, run_tests
+
     config = GooseConfig()
     test_target = target or config.TESTS_MODULE
 
@@ -50,13 +76,16 @@ def run(
     except ValueError as error:
         raise typer.BadParameter(str(error)) from error
 
-    store = _get_store()
-    passed_count, failures, total_duration = run_tests(definitions, verbose, store=store)
+    # Runs are stored under gooseapp/data/, where the dashboard reads them.
+    store = TestRunStore(config.gooseapp_dir / "data")
+    json_lines = output is OutputFormat.JSON
+    passed_count, failures, total_duration = run_tests(
+        definitions, verbose, store=store, jobs=jobs, json_lines=json_lines, exitfirst=exitfirst
+    )
 
-    passed_text = typer.style(str(passed_count), fg=colors.GREEN)
-    failed_text = typer.style(str(failures), fg=colors.RED)
-    duration_text = typer.style(f"{total_duration:.2f}s", fg=colors.CYAN)
-    typer.echo(f"{passed_text} passed, {failed_text} failed ({duration_text})")
+    # JSON output stays one record per line so it can be piped straight into other tools.
+    if not json_lines:
+        display_summary(passed_count, failures, total_duration)
 
     raise typer.Exit(code=1 if failures else 0)
 
@@ -69,6 +98,8 @@ def list_tests(
     ),
 ) -> None:
     """List discovered Goose tests without executing them."""
+    from goose.testing.discovery import load_from_qualified_name
+
     config = GooseConfig()
     test_target = target or config.TESTS_MODULE
 
@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 import os
 import pkgutil
 import sys
-from pathlib import Path
-from types import ModuleType
+import time
+from operator import itemgetter
+from types import FunctionType, ModuleType
 
 from goose.core.config import GooseConfig
-from goose.core.reload import collect_submodules, reload_module, reload_source_modules
+from goose.core.reload import _MTIME_GRANULARITY_NS, collect_submodules, reload_modules, reload_source_modules
 from goose.testing import fixtures as fixture_registry
 from goose.testing.exceptions import TestLoadError, UnknownTestError
 from goose.testing.models.tests import TestDefinition
@@ -22,48 +22,48 @@ FUNCTION_PREFIXES = ["test_"]
 
 def _is_test_module(name: str) -> bool:
     """Return True if *name* looks like a test module."""
-    leaf = name.rsplit(".", 1)[-1]
-    return any(leaf.startswith(prefix) for prefix in MODULE_PREFIXES)
+    leaf = name.rpartition(".")[2]
+    return leaf.startswith(tuple(MODULE_PREFIXES))
 
 
 def _collect_functions(module: ModuleType):
     """Yield TestDefinitions for test functions defined in *module*, ordered by line number."""
+    # Module attributes are read straight from its namespace: the result is sorted by line
+    # number below, so the sorted name list and per-name lookups of ``dir``/``getattr`` are wasted.
+    prefixes = tuple(FUNCTION_PREFIXES)
+    module_name = module.__name__
     functions = []
-    for name in dir(module):
-        if not any(name.startswith(prefix) for prefix in FUNCTION_PREFIXES):
+    for name, attr in vars(module).items():
+        if not name.startswith(prefixes):
             continue
-        attr = getattr(module, name)
-        if inspect.isfunction(attr) and attr.__module__ == module.__name__:
+        if isinstance(attr, FunctionType) and attr.__module__ == module_name:
             functions.append((attr.__code__.co_firstlineno, name, attr))
 
     # Sort by line number to preserve source order
-    functions.sort(key=lambda x: x[0])
+    functions.sort(key=itemgetter(0))
 
     for _lineno, name, func in functions:
         yield TestDefinition(module=module.__name__, name=name, func=func)
 
 
-def _ensure_test_import_paths() -> Path:
+def _ensure_test_import_paths(config: GooseConfig) -> None:
     """Ensure necessary paths are importable for test discovery.
 
     Adds the current working directory and the parent of tests_dir to sys.path.
     This allows importing project modules (e.g., gooseapp) and test modules.
+    Only precomputed path strings from *config* are used; nothing is resolved
+    on the filesystem besides the working directory.
     """
-    config = GooseConfig()
-    tests_path = config.tests_dir
-
-    # Ensure cwd is in path (for importing project modules like gooseapp)
+    # Ensure cwd is in path (for importing project modules like gooseapp), and
+    # the parent of tests_dir for test discovery (needed when tests_dir is a
+    # nested directory like tmp_path/sample_suite). sys.path is scanned once for
+    # both and the missing entries are prepended in a single splice, parent first;
+    # the common case is that both are already present.
     cwd = os.getcwd()
-    if cwd not in sys.path:
-        sys.path.insert(0, cwd)
-
-    # Also add parent of tests_dir for test discovery
-    # (needed when tests_dir is a nested directory like tmp_path/sample_suite)
-    parent_path = str(tests_path.parent)
-    if parent_path not in sys.path:
-        sys.path.insert(0, parent_path)
-
-    return tests_path
+    parent_path = config.tests_parent_str
+    missing = {cwd, parent_path}.difference(sys.path)
+    if missing:
+        sys.path[0:0] = [path for path in dict.fromkeys((parent_path, cwd)) if path in missing]
 
 
 def _collect_submodules_with_exclude(package_name: str, *, exclude_suffix: str | None = None) -> list[str]:
@@ -74,6 +74,65 @@ def _collect_submodules_with_exclude(package_name: str, *, exclude_suffix: str |
     return modules
 
 
+def _cached_import(module_name: str) -> ModuleType:
+    """Return *module_name* from ``sys.modules`` or import it.
+
+    Test modules have just been refreshed by ``_reload_test_package``, so
+    a fully initialized entry can be used without going through the
+    import machinery again.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__spec__", None) is not None:
+        return module
+    return importlib.import_module(module_name)
+
+
+# Test module names found under each package, with the mtimes of every directory
+# visited to find them. Adding, removing or renaming a module or subpackage changes
+# the mtime of its directory, so the walk is only repeated when the layout changes.
+# Walks are only cached once every visited directory has been left alone for longer
+# than the filesystem's mtime granularity, so a change made right after a walk is not missed.
+_WALK_CACHE: dict[str, tuple[tuple[tuple[str, int], ...], list[str]]] = {}
+
+
+def _directory_mtimes(directories: list[str]) -> tuple[tuple[str, int], ...] | None:
+    """Return ``(directory, mtime)`` pairs, or None if any directory is gone."""
+    try:
+        return tuple((directory, os.stat(directory).st_mtime_ns) for directory in directories)
+    except OSError:
+        return None
+
+
+def _test_module_names(package: ModuleType) -> list[str]:
+    """Return the names of all test modules under *package*, walking the filesystem only on change."""
+    cached = _WALK_CACHE.get(package.__name__)
+    if cached is not None and _directory_mtimes([directory for directory, _ in cached[0]]) == cached[0]:
+        return cached[1]
+
+    walk_started_ns = time.time_ns()
+    directories = list(package.__path__)
+    module_names: list[str] = []
+    cacheable = True
+    for finder, module_name, is_package in pkgutil.walk_packages(package.__path__, package.__name__ + "."):
+        if is_package:
+            finder_path = getattr(finder, "path", None)
+            if finder_path is None:
+                cacheable = False
+            else:
+                directories.append(os.path.join(finder_path, module_name.rsplit(".", 1)[-1]))
+        if _is_test_module(module_name):
+            module_names.append(module_name)
+
+    mtimes = _directory_mtimes(directories)
+    if cacheable and mtimes is not None and all(
+        walk_started_ns - mtime > _MTIME_GRANULARITY_NS for _, mtime in mtimes
+    ):
+        _WALK_CACHE[package.__name__] = (mtimes, module_names)
+    else:
+        _WALK_CACHE.pop(package.__name__, None)
+    return module_names
+
+
 def _try_as_package(qualified_name: str) -> list[TestDefinition] | None:
     """Try to resolve *qualified_name* as a package containing test modules.
 
@@ -81,16 +140,13 @@ def _try_as_package(qualified_name: str) -> list[TestDefinition] | None:
     Raises ModuleNotFoundError if the package doesn't exist.
     Raises other import errors (syntax errors, missing deps) from test modules.
     """
-    package = importlib.import_module(qualified_name)
+    package = _cached_import(qualified_name)
 
     if not hasattr(package, "__path__"):
         return None
 
     return [
-        defn
-        for _, module_name, _ in pkgutil.walk_packages(package.__path__, package.__name__ + ".")
-        if _is_test_module(module_name)
-        for defn in _collect_functions(importlib.import_module(module_name))
+        defn for module_name in _test_module_names(package) for defn in _collect_functions(_cached_import(module_name))
     ]
 
 
@@ -101,7 +157,7 @@ def _try_as_module(qualified_name: str) -> list[TestDefinition] | None:
     Raises ModuleNotFoundError if the module doesn't exist.
     Raises other import errors (syntax errors, missing deps).
     """
-    module = importlib.import_module(qualified_name)
+    module = _cached_import(qualified_name)
     definitions = list(_collect_functions(module))
     return definitions or None
 
@@ -119,10 +175,10 @@ def _try_as_function(qualified_name: str) -> list[TestDefinition] | None:
     module_name = ".".join(parts[:-1])
     func_name = parts[-1]
 
-    module = importlib.import_module(module_name)
+    module = _cached_import(module_name)
 
     attr = getattr(module, func_name, None)
-    if attr is not None and inspect.isfunction(attr) and attr.__module__ == module.__name__:
+    if isinstance(attr, FunctionType) and attr.__module__ == module.__name__:
         return [TestDefinition(module=module.__name__, name=func_name, func=attr)]
     return None
 
@@ -140,15 +196,17 @@ def load_from_qualified_name(qualified_name: str) -> list[TestDefinition]:
         - Test functions are top-level and named ``test_*``.
 
     Side effects (every call):
-        - Reloads configured source targets (agent, tools, etc.)
+        - Reloads configured source targets (agent, tools, etc.) if any of their files changed.
         - Resets the fixture registry, discarding previously registered fixtures.
         - Re-imports ``<root_package>.conftest`` to re-register fixtures.
-        - Refreshes test modules so file changes are picked up.
+        - Refreshes test modules so file changes are picked up. They are reloaded
+          when one of them changed or the source targets were reloaded.
+        - Keeps the fixtures registered by modules that were not reloaded.
 
     Note:
         Calling this function multiple times with the same input is safe but
-        will repeat all side effects. The fixture registry is always cleared,
-        so only fixtures from the most recent call remain active.
+        will repeat all side effects. Only fixtures registered by the modules
+        loaded as of the most recent call remain active.
 
     Args:
         qualified_name: Dotted target, e.g. ``"my_tests"``, ``"my_tests.test_foo"``,
@@ -169,21 +227,56 @@ def load_from_qualified_name(qualified_name: str) -> list[TestDefinition]:
         raise TestLoadError("Failed to load tests") from exc
 
 
-def _load_from_qualified_name(qualified_name: str) -> list[TestDefinition]:
-    """Internal implementation of load_from_qualified_name."""
-    root_package = qualified_name.split(".")[0]
+def reload_test_package(root_package: str) -> None:
+    """Hot-reload source targets, fixtures and test modules for *root_package*.
+
+    Performs the side effects of ``load_from_qualified_name`` without
+    resolving any target, so callers that already hold definitions can
+    refresh code once per batch and then use ``rebind_definition``.
+
+    Raises:
+        TestLoadError: If test code fails to load (syntax errors, missing imports, etc.).
+    """
+    try:
+        _reload_test_package(root_package)
+    except Exception as exc:
+        raise TestLoadError("Failed to load tests") from exc
 
-    _ensure_test_import_paths()
 
+def rebind_definition(definition: TestDefinition) -> TestDefinition:
+    """Return *definition* bound to the function currently defined in its module.
+
+    Looks the function up in the already-(re)loaded module; no import or
+    reload happens here.
+
+    Raises:
+        TestLoadError: If the module or the test function no longer exists,
+            e.g. because it was deleted since the definition was discovered.
+    """
+    module = sys.modules.get(definition.module)
+    attr = None
+    if module is not None:
+        attr = getattr(module, definition.name, None)
+    if not isinstance(attr, FunctionType) or attr.__module__ != definition.module:
+        raise TestLoadError(f"Test {definition.qualified_name!r} is no longer defined")
+    if attr is definition.func:
+        return definition
+    return TestDefinition(module=definition.module, name=definition.name, func=attr)
+
+
+def _reload_test_package(root_package: str) -> None:
+    """Internal implementation of reload_test_package."""
     config = GooseConfig()
+    _ensure_test_import_paths(config)
 
     # Clear fixture registry before reloading any modules
     # (conftest modules will re-register fixtures when reloaded)
+    previous_fixtures = dict(fixture_registry.fixtures)
     fixture_registry.reset_registry()
 
-    # Reload configured source targets in dependency order
+    # Reload configured source targets in dependency order, if any of them changed
     # Exclude conftest modules (handled separately below)
-    reload_source_modules(extra_exclude_suffixes=[".conftest"])
+    sources_reloaded = reload_source_modules(extra_exclude_suffixes=[".conftest"], only_if_changed=True)
 
     # Refresh the GooseApp instance after hot reload (if configured)
     # This ensures tools and other config are updated
@@ -196,9 +289,27 @@ def _load_from_qualified_name(qualified_name: str) -> list[TestDefinition]:
     else:
         importlib.import_module(conftest_name)
 
-    # Reload test modules so file changes are picked up
-    for module_name in _collect_submodules_with_exclude(root_package, exclude_suffix=".conftest"):
-        reload_module(module_name)
+    # Reload test modules so file changes are picked up. They hold references into the
+    # source modules, so they are reloaded whenever those were, and otherwise only if
+    # one of their own files changed.
+    test_modules = _collect_submodules_with_exclude(root_package, exclude_suffix=".conftest")
+    tests_reloaded = reload_modules(test_modules, only_if_changed=not sources_reloaded)
+    if sources_reloaded:
+        return
+
+    # Modules skipped by the mtime gate did not run again, so the fixtures they registered
+    # at import time are put back; those of re-executed modules were registered afresh.
+    reexecuted = {conftest_name}
+    if tests_reloaded:
+        reexecuted.update(test_modules)
+    for name, definition in previous_fixtures.items():
+        if definition.func.__module__ not in reexecuted:
+            fixture_registry.fixtures.setdefault(name, definition)
+
+
+def _load_from_qualified_name(qualified_name: str) -> list[TestDefinition]:
+    """Internal implementation of load_from_qualified_name."""
+    _reload_test_package(qualified_name.split(".")[0])
 
     # Attempt resolution strategies in order
     for resolver in (_try_as_package, _try_as_module, _try_as_function):
@@ -216,4 +327,4 @@ def _load_from_qualified_name(qualified_name: str) -> list[TestDefinition]:
     raise UnknownTestError(f"Could not resolve qualified name: {qualified_name!r}")
 
 
-__all__ = ["load_from_qualified_name"]
+__all__ = ["load_from_qualified_name", "rebind_definition", "reload_test_package"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
+from datetime import date
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
@@ -12,6 +14,32 @@ from goose.testing.test_case import ExpectedToolCall, TestCase
 from goose.testing.validator import AgentValidator
 
 
+# Validators built by model name, per thread: tests run on a thread pool and the LangChain
+# agent makes no guarantee that concurrent ``invoke`` calls are safe. Each thread holds a
+# ``validators`` dict mapping a model name to the day it was built for and the validator.
+_thread_validators = threading.local()
+
+
+def _shared_validator(chat_model: str, day: date) -> AgentValidator:
+    """Return this thread's validator for *chat_model* on *day*, building it on first use.
+
+    The ``goose`` fixture is usually rebuilt for every test, while building the
+    LangChain agent is the expensive part of validation. The day is stated in
+    the validator's system prompt, so a validator built on an earlier day is
+    replaced. Validators are dropped together with their thread.
+    """
+    validators: dict[str, tuple[date, AgentValidator]] | None = getattr(_thread_validators, "validators", None)
+    if validators is None:
+        validators = {}
+        _thread_validators.validators = validators
+    cached = validators.get(chat_model)
+    if cached is not None and cached[0] == day:
+        return cached[1]
+    validator = AgentValidator(chat_model=chat_model, current_date=day)
+    validators[chat_model] = (day, validator)
+    return validator
+
+
 class Goose:
     """Testing helper that wraps the agent, validator, and lifecycle hooks."""
 
@@ -31,7 +59,11 @@ class Goose:
     def _get_validation_agent(self) -> AgentValidator:
         """Build the validator only when expectation evaluation is needed."""
         if self._validation_agent is None:
-            self._validation_agent = AgentValidator(chat_model=self._validator_model)
+            # Model instances may carry per-test state, so only validators named by model are shared.
+            if isinstance(self._validator_model, str):
+                self._validation_agent = _shared_validator(self._validator_model, date.today())
+            else:
+                self._validation_agent = AgentValidator(chat_model=self._validator_model)
         return self._validation_agent
 
     def case(
@@ -62,6 +94,10 @@ class Goose:
         self._test_case.last_response = response
         self._test_case.validate_tool_calls(actual_tool_call_names=response.tool_call_names)
 
+        # Without expectations there is nothing to judge; skip the validator round-trip.
+        if not self._test_case.expectations:
+            return
+
         evaluation = self._get_validation_agent().evaluate(
             agent_output=response, expectations=self._test_case.expectations
         )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import traceback
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,6 +23,14 @@ class TestLoadError(Exception):
         self.message = message
         super().__init__(message)
 
+    @functools.cached_property
+    def detail(self) -> str:
+        """Return the message with the formatted cause traceback, rendered on first access."""
+        cause = self.__cause__
+        if cause is None:
+            return self.message
+        return f"{self.message}:\n\n{''.join(traceback.format_exception(cause))}"
+
 
 class AgentQueryError(Exception):
     """Exception that captures partial agent response on failure.
@@ -3,23 +3,49 @@
 from __future__ import annotations
 
 import inspect
+import weakref
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from goose.testing.engine import Goose
 
 
-@dataclass
+@dataclass(slots=True)
 class FixtureDefinition:
     """Single registered fixture."""
 
     func: Callable[..., Any]
     autouse: bool = False
+    parameters: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Read the factory's parameter names once; the fixture is resolved for every test."""
+
+        self.parameters = _parameter_names(self.func)
 
 
 fixtures: dict[str, FixtureDefinition] = {}
 
+# Parameter names per callable. Held weakly so functions replaced by a hot reload drop out.
+_PARAMETER_NAMES: weakref.WeakKeyDictionary[Callable[..., Any], tuple[str, ...]] = weakref.WeakKeyDictionary()
+
+
+def _parameter_names(func: Callable[..., Any]) -> tuple[str, ...]:
+    """Return the parameter names of *func*, building its signature only once per function."""
+
+    try:
+        return _PARAMETER_NAMES[func]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable; nothing to cache it by.
+        return tuple(inspect.signature(func).parameters)
+
+    names = tuple(inspect.signature(func).parameters)
+    _PARAMETER_NAMES[func] = names
+    return names
+
 
 def register(name: str, func: Callable[..., Any], *, autouse: bool = False) -> None:
     """Register a fixture factory under *name*.
@@ -58,20 +84,20 @@ def _resolve(name: str, cache: dict[str, Any]) -> Any:
         The computed value of the fixture.
     """
 
-    definition = fixtures.get(name)
-    if definition is None:
-        raise KeyError(f"Unknown fixture '{name}'")
-
+    # Shared dependencies are mostly already resolved for this test; check the cache first.
     cached = cache.get(name, _MISSING)
     if cached is _RESOLVING:
         raise RuntimeError(f"Circular fixture dependency detected for '{name}'")
     if cached is not _MISSING:
         return cached
 
+    definition = fixtures.get(name)
+    if definition is None:
+        raise KeyError(f"Unknown fixture '{name}'")
+
     cache[name] = _RESOLVING
     try:
-        parameters = inspect.signature(definition.func).parameters
-        kwargs = {param: _resolve(param, cache) for param in parameters}
+        kwargs = {param: _resolve(param, cache) for param in definition.parameters}
         value = definition.func(**kwargs)
     except Exception:  # pragma: no cover - propagate after cleanup
         cache.pop(name, None)
@@ -126,8 +152,7 @@ def build_call_arguments(func: Callable[..., Any], cache: dict[str, Any]) -> dic
         A dict of parameter names to resolved fixture values.
     """
 
-    parameters = inspect.signature(func).parameters
-    return {param: _resolve(param, cache) for param in parameters}
+    return {param: _resolve(param, cache) for param in _parameter_names(func)}
 
 
 def extract_goose_fixture(cache: dict[str, Any]) -> Goose:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import traceback
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -20,12 +21,12 @@ class TestDefinition:
     module: str
     name: str
     func: Callable[..., Any]
+    qualified_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def qualified_name(self) -> str:
-        """Return the fully-qualified name of the test function."""
+    def __post_init__(self) -> None:
+        """Build the fully-qualified name once; interned since it keys every status map."""
 
-        return f"{self.module}.{self.name}"
+        self.qualified_name = sys.intern(f"{self.module}.{self.name}")
 
 
 @dataclass(slots=True)
@@ -42,6 +43,18 @@ class ValidationResult:
     error_type: ErrorType | None = None
 
 
+def _format_and_release(exception: BaseException) -> str:
+    """Format *exception* with its traceback, then clear the locals of the frames it references.
+
+    The formatted text is all that is reported, but a result keeps its exception,
+    whose traceback would otherwise pin every local of the failing test (agent
+    responses, clients, fixture values) for as long as the result is held.
+    """
+    formatted = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+    traceback.clear_frames(exception.__traceback__)
+    return formatted
+
+
 # pylint: disable=too-many-instance-attributes
 @dataclass(slots=True)
 class TestResult:
@@ -86,18 +99,13 @@ class TestResult:
             self.failure_reasons = self.exception.failure_reasons
 
         elif isinstance(self.exception, AssertionError):
-            formatted = "".join(
-                traceback.format_exception(type(self.exception), self.exception, self.exception.__traceback__)
-            )
-            self.error_message = formatted
+            self.error_message = _format_and_release(self.exception)
             self.error_type = ErrorType.VALIDATION
             self.expectations_unmet = []
             self.failure_reasons = {}
 
         else:
-            self.error_message = "".join(
-                traceback.format_exception(type(self.exception), self.exception, self.exception.__traceback__)
-            )
+            self.error_message = _format_and_release(self.exception)
             self.error_type = ErrorType.UNEXPECTED
             self.expectations_unmet = []
             self.failure_reasons = {}
@@ -7,19 +7,130 @@ used by the dashboard so history is shared between CLI and UI.
 
 from __future__ import annotations
 
-import json
+import functools
+import sys
 import uuid
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass
 from typing import Any
 
-from typer import colors, echo, style
+import orjson
 
 from goose.testing.api.persistence import TestRunStore
 from goose.testing.api.schema import TestResultModel
+from goose.testing.errors import ErrorType
 from goose.testing.models.tests import TestResult
-from goose.testing.runner import execute_test
+from goose.testing.runner import execute_tests
 
+# ANSI sequences matching what ``typer.style`` emits, so the per-result path
+# formats plain f-strings instead of re-resolving colors for every test.
+_RESET = "\x1b[0m"
+_BOLD = "\x1b[1m"
+_RED = "\x1b[31m"
+_GREEN = "\x1b[32m"
+_YELLOW = "\x1b[33m"
+_BLUE = "\x1b[34m"
+_MAGENTA = "\x1b[35m"
+_CYAN = "\x1b[36m"
+_WHITE = "\x1b[37m"
 
-def run_tests(definitions: list, verbose: bool, *, store: TestRunStore | None = None) -> tuple[int, int, float]:
+# Verbose transcripts pretty-print every tool call's arguments and result. Keys keep the
+# order the model and the tool produced them in, which is what readers expect, so they
+# are not re-sorted for every payload.
+_PRETTY_JSON = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+@dataclass(frozen=True, slots=True)
+class _Palette:
+    """Pre-rendered labels and color codes for one color mode."""
+
+    reset: str
+    red: str
+    green: str
+    cyan: str
+    magenta: str
+    yellow: str
+    pass_label: str
+    fail_label: str
+    divider: str
+    conversation_header: str
+    human_label: str
+    agent_label: str
+    error_markers: dict[ErrorType, str]
+
+
+def _build_palette(color: bool) -> _Palette:
+    """Render every fixed label once, with ANSI styling or as plain text."""
+
+    def code(sequence: str) -> str:
+        if color:
+            return sequence
+        return ""
+
+    reset = code(_RESET)
+    red = code(_RED)
+    green = code(_GREEN)
+    cyan = code(_CYAN)
+    blue = code(_BLUE)
+    return _Palette(
+        reset=reset,
+        red=red,
+        green=green,
+        cyan=cyan,
+        magenta=code(_MAGENTA),
+        yellow=code(_YELLOW),
+        pass_label=f"{green}PASS{reset}",
+        fail_label=f"{red}FAIL{reset}",
+        divider=f"{code(_WHITE)}{'-' * 40}{reset}",
+        conversation_header=f"{cyan}{code(_BOLD)}Conversation{reset}",
+        human_label=f"{blue}Human{reset}",
+        agent_label=f"{green}Agent{reset}",
+        error_markers={error_type: f"{red}[ERROR: {error_type.value}]{reset}" for error_type in ErrorType},
+    )
+
+
+_STYLED = _build_palette(color=True)
+_PLAIN = _build_palette(color=False)
+
+
+@functools.cache
+def _palette() -> _Palette:
+    """Return the palette for stdout, styled only when it is a terminal.
+
+    Resolved once instead of probing ``isatty`` for every write; the answer
+    does not change during a run. Picking plain labels up front is cheaper
+    than styling every line and stripping the codes again.
+    """
+    try:
+        color = sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        color = False
+    if color:
+        return _STYLED
+    return _PLAIN
+
+
+def _write(message: str) -> None:
+    """Write *message* and a newline to stdout.
+
+    Bypasses ``typer.echo``, which resolves the Click context and the color
+    default on every call.
+    """
+    stdout = sys.stdout
+    stdout.write(f"{message}\n")
+    stdout.flush()
+
+
+def run_tests(
+    definitions: list,
+    verbose: bool,
+    *,
+    store: TestRunStore | None = None,
+    jobs: int = 1,
+    json_lines: bool = False,
+    exitfirst: bool = False,
+) -> tuple[int, int, float]:
     """Execute tests and return (passed, failures, total_duration).
 
     Args:
@@ -27,48 +138,86 @@ def run_tests(definitions: list, verbose: bool, *, store: TestRunStore | None =
         verbose: Whether to display conversational transcripts.
         store: Optional persistence store. When provided, each result
                is saved so the dashboard can display CLI-initiated runs.
+        jobs: Number of tests to execute concurrently. Tests spend most of
+              their time waiting on model providers, so threads overlap
+              that I/O. Concurrent results are displayed and stored as
+              they complete, not in definition order.
+        json_lines: Write each result as one line of JSON, shaped like the
+                    dashboard's result payload, instead of the colored report.
+        exitfirst: Stop after the first failing test. Tests that have not
+                   started yet are not executed.
     """
+    # Closing the runner cancels tests that were submitted but not started.
+    with closing(execute_tests(definitions, jobs=jobs)) as completed:
+        results = (result for _, result in completed)
+        return _report_results(results, verbose, store=store, json_lines=json_lines, exitfirst=exitfirst)
+
+
+def _report_results(
+    results: Iterable[TestResult],
+    verbose: bool,
+    *,
+    store: TestRunStore | None,
+    json_lines: bool = False,
+    exitfirst: bool = False,
+) -> tuple[int, int, float]:
+    """Display and persist *results* as they arrive and return (passed, failures, total_duration)."""
     job_id = str(uuid.uuid4())
+    # Bound once so the per-result loop does not look them up on every iteration.
+    display = display_result
+    to_model = TestResultModel.from_result
+    add_run = None
+    if store is not None:
+        add_run = store.add_run
+
     failures = 0
     total = 0
     total_duration = 0.0
-    for definition in definitions:
-        result = execute_test(definition)
-        total += 1
+    for total, result in enumerate(results, start=1):
         total_duration += result.duration
-        failures += display_result(result, verbose=verbose)
+        # The API model is built at most once, whether it is printed, stored or both.
+        model = None
+        if json_lines or add_run is not None:
+            model = to_model(result)
+
+        if json_lines:
+            failures += _display_result_json(model)
+        else:
+            failures += display(result, verbose=verbose)
 
-        if store is not None:
-            store.add_run(job_id, TestResultModel.from_result(result))
+        if add_run is not None:
+            add_run(job_id, model)
+
+        if exitfirst and failures:
+            break
 
     return total - failures, failures, total_duration
 
 
 def display_result(result: TestResult, *, verbose: bool) -> int:
-    """Render a single test result and report whether it failed."""
+    """Render a single test result and report whether it failed.
+
+    The result's lines are collected first and written at once, so
+    each result costs a single write to stdout however verbose it is.
+    """
+    palette = _palette()
     if result.passed:
-        status_label = "PASS"
-        status_color = colors.GREEN
+        status_text = palette.pass_label
     else:
-        status_label = "FAIL"
-        status_color = colors.RED
+        status_text = palette.fail_label
 
-    status_text = style(status_label, fg=status_color)
-    duration_text = style(f"{result.duration:.2f}s", fg=colors.CYAN)
-    echo(f"{status_text} {result.name} ({duration_text})")
+    lines = [f"{status_text} {result.name} ({palette.cyan}{result.duration:.2f}s{palette.reset})"]
 
     if verbose:
-        _display_verbose_details(result)
+        _append_verbose_details(result, lines, palette)
 
     if not result.passed:
         assert result.error_type is not None
-        divider = style("-" * 40, fg=colors.WHITE)
-        marker = style(f"[ERROR: {result.error_type.value}]", fg=colors.RED)
-        body = style(result.error_message, fg=colors.RED)
+        lines.append(palette.divider)
+        lines.append(f"{palette.error_markers[result.error_type]} {palette.red}{result.error_message}{palette.reset}")
+        lines.append(palette.divider)
 
-        echo(divider)
-        echo(f"{marker} {body}")
-        echo(divider)
+    _write("\n".join(lines))
 
     if result.passed:
         return 0
@@ -76,74 +225,92 @@ def display_result(result: TestResult, *, verbose: bool) -> int:
     return 1
 
 
-def _display_verbose_details(result: TestResult) -> None:  # pylint: disable=too-many-branches,too-many-statements
-    """Emit conversational details for verbose runs."""
+def _display_result_json(model: TestResultModel) -> int:
+    """Write *model* as a single line of JSON and report whether it failed."""
+    _write(model.model_dump_json())
+    if model.passed:
+        return 0
+
+    return 1
+
+
+def display_summary(passed: int, failures: int, total_duration: float) -> None:
+    """Write the end-of-run totals as a single line."""
+    palette = _palette()
+    reset = palette.reset
+    _write(
+        f"{palette.green}{passed}{reset} passed, {palette.red}{failures}{reset} failed "
+        f"({palette.cyan}{total_duration:.2f}s{reset})"
+    )
+
+
+def _append_verbose_details(  # pylint: disable=too-many-branches,too-many-statements
+    result: TestResult,
+    lines: list[str],
+    palette: _Palette,
+) -> None:
+    """Append conversational details for verbose runs to *lines*."""
+    emit = lines.append
     test_case = result.test_case
-    header = style("Conversation", fg=colors.CYAN, bold=True)
-    echo(header)
+    emit(palette.conversation_header)
 
     if test_case is None:
-        echo("No test case data recorded.")
+        emit("No test case data recorded.")
         return
 
     response = test_case.last_response
     if response is None:
-        echo("No agent response captured.")
-        echo(test_case.query_message)
+        emit("No agent response captured.")
+        emit(test_case.query_message)
         return
 
     rendered_human = False
     for message in response.messages:
         if message.type == "human":
             rendered_human = True
-            label = style("Human", fg=colors.BLUE)
-            echo(label)
-            echo(message.content)
-            echo("")
+            emit(palette.human_label)
+            emit(message.content)
+            emit("")
             continue
         if message.type == "ai":
-            label = style("Agent", fg=colors.GREEN)
-            echo(label)
+            emit(palette.agent_label)
             if message.content:
-                echo("Response:")
-                echo(message.content)
+                emit("Response:")
+                emit(message.content)
             if message.tool_calls:
-                echo("Tool Calls:")
+                emit("Tool Calls:")
                 for tool_call in message.tool_calls:
-                    echo(f"- {tool_call.name}")
+                    emit(f"- {tool_call.name}")
                     if tool_call.args:
-                        echo("Args:")
-                        echo(_format_json_data(tool_call.args))
+                        emit("Args:")
+                        emit(_format_json_data(tool_call.args))
                     if tool_call.id:
-                        echo(f"Id: {tool_call.id}")
-                    echo("")
+                        emit(f"Id: {tool_call.id}")
+                    emit("")
             else:
-                echo("")
+                emit("")
             continue
         if message.type == "tool":
             tool_name = "tool"
             if message.tool_name is not None:
                 tool_name = message.tool_name
-            label = style(f"Tool Result ({tool_name})", fg=colors.MAGENTA)
-            echo(label)
-            echo(_format_json_text(message.content))
-            echo("")
+            emit(f"{palette.magenta}Tool Result ({tool_name}){palette.reset}")
+            emit(_format_json_text(message.content))
+            emit("")
             continue
-        label = style(message.type.title(), fg=colors.YELLOW)
-        echo(label)
-        echo(message.content)
-        echo("")
+        emit(f"{palette.yellow}{message.type.title()}{palette.reset}")
+        emit(message.content)
+        emit("")
 
     if not rendered_human and test_case.query_message:
-        label = style("Human", fg=colors.BLUE)
-        echo(label)
-        echo(test_case.query_message)
+        emit(palette.human_label)
+        emit(test_case.query_message)
 
 
 def _format_json_data(data: Any) -> str:
     """Return pretty JSON for structured data."""
     try:
-        return json.dumps(data, indent=2, sort_keys=True)
+        return orjson.dumps(data, option=_PRETTY_JSON).decode()
     except TypeError:
         return str(data)
 
@@ -151,7 +318,7 @@ def _format_json_data(data: Any) -> str:
 def _format_json_text(payload: str) -> str:
     """Render JSON strings with indentation when possible."""
     try:
-        parsed = json.loads(payload)
-    except (TypeError, json.JSONDecodeError):
+        parsed = orjson.loads(payload)
+    except orjson.JSONDecodeError:
         return payload
     return _format_json_data(parsed)
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from typing import Any
 
-from goose.testing.discovery import load_from_qualified_name
 from goose.testing.fixtures import apply_autouse, build_call_arguments, extract_goose_fixture
 from goose.testing.models.tests import TestDefinition, TestResult
 
@@ -13,17 +15,16 @@ from goose.testing.models.tests import TestDefinition, TestResult
 def execute_test(definition: TestDefinition) -> TestResult:
     """Execute a single Goose test with fixtures and hooks.
 
+    The definition is executed as given; callers are responsible for
+    reloading test code beforehand (see ``reload_test_package``).
+
     Args:
         definition: The test definition to run.
 
     Returns:
         The result of the test execution, including pass/fail status and metadata.
     """
-    refreshed_definitions = load_from_qualified_name(definition.qualified_name)
-    if refreshed_definitions:
-        definition = refreshed_definitions[0]
-
-    start = time.time()
+    start_ns = time.perf_counter_ns()
     fixture_cache: dict[str, Any] = {}
 
     kwargs = build_call_arguments(definition.func, fixture_cache)
@@ -35,7 +36,7 @@ def execute_test(definition: TestDefinition) -> TestResult:
     exception = _execute(definition, kwargs)
     goose_instance.hooks.post_test(definition)
 
-    duration = time.time() - start
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
     test_case = goose_instance.consume_test_case()
 
     return TestResult(definition=definition, duration=duration, test_case=test_case, exception=exception)
@@ -50,4 +51,80 @@ def _execute(definition: TestDefinition, kwargs: dict[str, Any]) -> Exception |
         return exc
 
 
-__all__ = ["execute_test"]
+def execute_tests(
+    definitions: Sequence[TestDefinition],
+    *,
+    jobs: int = 1,
+    on_start: Callable[[int], None] | None = None,
+    pool: ThreadPoolExecutor | None = None,
+) -> Iterator[tuple[int, TestResult]]:
+    """Execute *definitions* and yield ``(index, result)`` pairs as tests complete.
+
+    With ``jobs=1`` tests run one after another on the calling thread. Otherwise
+    up to *jobs* tests run at a time on worker threads; tests spend most of
+    their time waiting on model providers, so threads overlap that I/O.
+    Results are always yielded on the calling thread.
+
+    Args:
+        definitions: Test definitions to execute.
+        jobs: Maximum number of tests to execute concurrently.
+        on_start: Called with a definition's index just before it is executed
+                  or handed to a worker thread.
+        pool: Executor to run concurrent tests on. Long-lived callers pass
+              their own so worker threads are reused between calls; by
+              default a pool is created for this call and shut down after it.
+
+    Yields:
+        The index of each definition with its result, in completion order.
+    """
+    if jobs <= 1 or len(definitions) <= 1:
+        for index, definition in enumerate(definitions):
+            if on_start is not None:
+                on_start(index)
+            yield index, execute_test(definition)
+        return
+
+    if pool is not None:
+        yield from _execute_concurrently(pool, definitions, window=jobs, on_start=on_start)
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs) as own_pool:
+        yield from _execute_concurrently(own_pool, definitions, window=jobs, on_start=on_start)
+
+
+def _execute_concurrently(
+    pool: ThreadPoolExecutor,
+    definitions: Sequence[TestDefinition],
+    *,
+    window: int,
+    on_start: Callable[[int], None] | None,
+) -> Iterator[tuple[int, TestResult]]:
+    """Yield results as tests complete, with at most *window* tests submitted at a time.
+
+    A slow test does not hold back the results of faster ones. Submitting
+    lazily keeps an interrupted run from executing the rest of the suite
+    while the pool shuts down.
+    """
+    pending: dict[Future[TestResult], int] = {}
+    remaining = iter(enumerate(definitions))
+
+    def submit(count: int) -> None:
+        for index, definition in islice(remaining, count):
+            if on_start is not None:
+                on_start(index)
+            pending[pool.submit(execute_test, definition)] = index
+
+    try:
+        submit(window)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            # Refill before reporting so workers are not idle while results are handled.
+            submit(len(done))
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+__all__ = ["execute_test", "execute_tests"]
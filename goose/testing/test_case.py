@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import inspect
+import sys
 from collections.abc import Callable, Mapping
 from typing import Any, NoReturn, Protocol
 
@@ -77,6 +78,14 @@ class TestCase:
     """Represents a single test case for agent behavior validation."""
 
     __test__ = False
+    __slots__ = (
+        "query_message",
+        "expectations",
+        "last_response",
+        "_expected_tool_calls",
+        "_expected_tool_call_names",
+        "_expected_tool_call_name_set",
+    )
 
     def __init__(
         self,
@@ -90,17 +99,27 @@ class TestCase:
         self.expected_tool_calls = expected_tool_calls
         self.last_response: AgentResponse | None = None
 
-        # Validate expected_tool_calls contains actual tools
+    @property
+    def expected_tool_calls(self) -> list[ExpectedToolCall] | None:
+        """Tools the agent is expected to call, as passed to the test case."""
+        return self._expected_tool_calls
+
+    @expected_tool_calls.setter
+    def expected_tool_calls(self, expected_tool_calls: list[ExpectedToolCall] | None) -> None:
+        # Validate expected_tool_calls contains actual tools, resolving each name once
+        # instead of on every validation and serialization. Names are interned so lookups
+        # of tool names that are themselves interned (e.g. function names) match by identity.
+        names: tuple[str, ...] = ()
         if expected_tool_calls:
-            for item in expected_tool_calls:
-                _extract_expected_tool_call_name(item)
+            names = tuple(sys.intern(_extract_expected_tool_call_name(item)) for item in expected_tool_calls)
+        self._expected_tool_calls = expected_tool_calls
+        self._expected_tool_call_names = names
+        self._expected_tool_call_name_set = frozenset(names)
 
     @property
     def expected_tool_call_names(self) -> list[str]:
         """Return the names of the expected tool calls."""
-        if not self.expected_tool_calls:
-            return []
-        return [_extract_expected_tool_call_name(tool) for tool in self.expected_tool_calls]
+        return list(self._expected_tool_call_names)
 
     def validate_tool_calls(self, actual_tool_call_names: list[str]) -> None:
         """Ensure that expected tool calls were made.
@@ -110,14 +129,10 @@ class TestCase:
         if self.expected_tool_calls is None:
             return
 
-        expected_tool_call_names_set = set(self.expected_tool_call_names)
-        actual_tool_call_names_set = set(actual_tool_call_names)
-
-        missing_tools = expected_tool_call_names_set - actual_tool_call_names_set
-        if missing_tools:
+        if not self._expected_tool_call_name_set.issubset(actual_tool_call_names):
             raise ToolCallValidationError(
-                expected_tool_calls=expected_tool_call_names_set,
-                actual_tool_calls=actual_tool_call_names_set,
+                expected_tool_calls=set(self._expected_tool_call_name_set),
+                actual_tool_calls=set(actual_tool_call_names),
             )
 
     def validate_expectations(self, evaluation: ExpectationsEvaluationResponse) -> None:
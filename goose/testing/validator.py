@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date
 
 from dotenv import load_dotenv  # pylint: disable=import-error
-from langchain.agents import create_agent
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel, Field
@@ -44,16 +43,26 @@ class ExpectationsEvaluationResponse(BaseModel):
 class AgentValidator:
     """Encapsulated agent validator for testing LLM behavior."""
 
-    def __init__(self, chat_model: BaseChatModel | str) -> None:
-        """Build the LangChain validator agent without tools."""
-        current_date = datetime.now().strftime("%B %d, %Y")
+    def __init__(self, chat_model: BaseChatModel | str, *, current_date: date | None = None) -> None:
+        """Build the LangChain validator agent without tools.
+
+        Args:
+            chat_model: The model, or model name, that judges the expectations.
+            current_date: The date stated in the system prompt; defaults to today.
+        """
+        # langchain.agents pulls in LangGraph; importing it here keeps it off the path of
+        # everything that only imports goose.testing, such as `goose --help`.
+        from langchain.agents import create_agent  # pylint: disable=import-outside-toplevel
+
+        if current_date is None:
+            current_date = date.today()
         self._agent = create_agent(
             model=chat_model,
             tools=[],  # No tools needed for validation
             response_format=ExpectationsEvaluationResponse,
             system_prompt=f"""You are an expert validator for LLM agent behavior testing.
 
-Current date: {current_date}
+Current date: {current_date.strftime("%B %d, %Y")}
 
 TASK: Analyze agent execution output against numbered expectations and determine which expectations were met or unmet.
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 
@@ -41,6 +43,28 @@ def get_tool_name(func: Callable) -> str:
     return func.__name__
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory, or ``None`` for the default event loop.
+
+    uvloop is optional; it is used when installed unless ``GOOSE_DISABLE_UVLOOP=1`` is set.
+    """
+    if os.environ.get("GOOSE_DISABLE_UVLOOP") == "1":
+        return None
+    try:
+        import uvloop  # type: ignore[import-not-found]  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def _run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run *coroutine* to completion on a fresh event loop.
+
+    The loop factory is passed to this run only; the global event loop policy is left untouched.
+    """
+    return asyncio.run(coroutine, loop_factory=_loop_factory())
+
+
 def invoke_tool(tool: Callable, args: dict[str, Any]) -> Any:
     """Invoke a LangChain tool with the given arguments.
 
@@ -66,22 +90,13 @@ def invoke_tool(tool: Callable, args: dict[str, Any]) -> Any:
 
             # Handle async results
             if asyncio.iscoroutine(result):
-                loop = asyncio.new_event_loop()
-                try:
-                    result = loop.run_until_complete(result)
-                finally:
-                    loop.close()
+                result = _run_coroutine(result)
 
             return result
 
         # Direct function call for plain functions (shouldn't happen with @tool)
         if inspect.iscoroutinefunction(tool):
-            loop = asyncio.new_event_loop()
-            try:
-                result = loop.run_until_complete(tool(**args))
-            finally:
-                loop.close()
-            return result
+            return _run_coroutine(tool(**args))
 
         return tool(**args)
 
@@ -113,17 +128,17 @@ async def invoke_tool_async(tool: Callable, args: dict[str, Any]) -> Any:
         if hasattr(tool, "ainvoke"):
             return await tool.ainvoke(args)
 
-        # Fall back to invoke in a thread pool
+        # Fall back to invoke in a thread pool. run_in_executor is used rather than
+        # asyncio.to_thread: tools do not read the caller's context variables, so the
+        # per-call context copy can be skipped.
         if hasattr(tool, "invoke"):
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, tool.invoke, args)
+            return await asyncio.get_running_loop().run_in_executor(None, tool.invoke, args)
 
         # Direct function call
         if inspect.iscoroutinefunction(tool):
             return await tool(**args)
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: tool(**args))
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(tool, **args))
 
     except Exception as exc:
         raise ToolExecutionError(
@@ -219,6 +219,19 @@ class TestTestRunStore:
         runs = store.get_runs_for_test("test_module.test_one")
         assert runs == []
 
+    def test_history_with_unknown_result_fields_still_loads(self, tmp_path: Path) -> None:
+        store = TestRunStore(tmp_path)
+        store.add_run("job-1", _make_result("test_module.test_one"))
+
+        # Simulate a history file written by a version with an extra result field
+        history_file = tmp_path / "history" / "test_module.test_one.json"
+        data = json.loads(history_file.read_text())
+        data["runs"][0]["result"]["retired_field"] = "value"
+        history_file.write_text(json.dumps(data))
+
+        runs = TestRunStore(tmp_path).get_runs_for_test("test_module.test_one")
+        assert [run.id for run in runs] == ["job-1"]
+
     def test_creates_data_directory_if_missing(self, tmp_path: Path) -> None:
         nested_path = tmp_path / "nested" / "data" / "dir"
         store = TestRunStore(nested_path)
@@ -314,3 +327,29 @@ class TestTestRunStore:
         assert store.delete_run_at_index("test_module.test_one", 5) is False
         assert store.delete_run_at_index("test_module.test_one", -1) is False
         assert store.delete_run_at_index("test_module.nonexistent", 0) is False
+
+    def test_history_files_are_parsed_once_until_they_change(self, tmp_path: Path, monkeypatch) -> None:
+        store = TestRunStore(tmp_path)
+        store.add_run("job-1", _make_result("test_module.test_one"))
+        store.add_run("job-2", _make_result("test_module.test_one"))
+
+        parsed: list[object] = []
+        validate = TestRunHistory.model_validate
+
+        def counting_validate(data: object) -> TestRunHistory:
+            parsed.append(data)
+            return validate(data)
+
+        monkeypatch.setattr(TestRunHistory, "model_validate", counting_validate)
+
+        assert len(store.get_runs_for_test("test_module.test_one")) == 2
+        assert store.run_count() == 2
+        assert parsed == []
+
+        # Another process appending to the file is picked up on the next read.
+        other_store = TestRunStore(tmp_path)
+        other_store.add_run("job-3", _make_result("test_module.test_one"))
+
+        assert len(parsed) == 1
+        assert [run.id for run in store.get_runs_for_test("test_module.test_one")] == ["job-1", "job-2", "job-3"]
+        assert len(parsed) == 2
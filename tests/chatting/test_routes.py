@@ -239,3 +239,20 @@ class TestConversationWebSocket:
         with client.websocket_connect(f"/chatting/ws/conversations/{conversation_id}") as websocket:
             # Just verify we can connect - we'd need a mock agent to fully test streaming
             websocket.close()
+
+    def test_sends_events_as_binary_json_frames(self, client: TestClient, config_with_agents: GooseConfig) -> None:
+        """Stream events are delivered as binary frames of UTF-8 JSON."""
+        agents_response = client.get("/chatting/agents")
+        agent_id = agents_response.json()[0]["id"]
+
+        create_response = client.post(
+            "/chatting/conversations",
+            json={"agent_id": agent_id},
+        )
+        conversation_id = create_response.json()["id"]
+
+        with client.websocket_connect(f"/chatting/ws/conversations/{conversation_id}") as websocket:
+            websocket.send_text("not json")
+            event = websocket.receive_json(mode="binary")
+
+        assert event == {"type": "error", "data": {"message": "Invalid JSON"}}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from goose.chatting.store import ConversationStore, get_store, reset_store
@@ -134,6 +136,20 @@ class TestConversationStore:
         assert len(fetched.messages) == 1
         assert fetched.messages[0].content == "Hello"
 
+    def test_add_message_stores_precomputed_dump(self) -> None:
+        """A dump passed by the caller is stored instead of dumping again."""
+        store = ConversationStore()
+        created = store.create(agent_id="a1", agent_name="Agent")
+
+        message = Message(type="human", content="Hello")
+        dumped = message.model_dump()
+        with patch.object(Message, "model_dump", side_effect=AssertionError("dumped twice")):
+            store.add_message(created.id, message, dumped=dumped)
+
+        fetched = store.get(created.id)
+        assert fetched is not None
+        assert fetched.messages[0].content == "Hello"
+
     def test_add_message_updates_timestamp(self) -> None:
         """Adding message updates updated_at."""
         store = ConversationStore()
@@ -181,6 +197,21 @@ class TestConversationStore:
         assert len(fetched.title) == 53  # 50 chars + "..."
         assert fetched.title.endswith("...")
 
+    def test_langchain_messages_convert_only_new_messages(self) -> None:
+        """LangChain conversions are reused across turns."""
+        store = ConversationStore()
+        created = store.create(agent_id="a1", agent_name="Agent")
+        store.add_message(created.id, Message(type="human", content="Hello"))
+
+        first = store.get_langchain_messages(created.id)
+        store.add_message(created.id, Message(type="ai", content="Hi"))
+        second = store.get_langchain_messages(created.id)
+
+        assert first is not None and second is not None
+        assert [m.content for m in second] == ["Hello", "Hi"]
+        assert second[0] is first[0]
+        assert store.get_langchain_messages("unknown-id") is None
+
     def test_clear_removes_all(self) -> None:
         """Clear removes all conversations."""
         store = ConversationStore()
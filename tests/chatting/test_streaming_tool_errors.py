@@ -6,9 +6,9 @@ import asyncio
 import json
 from typing import Any
 
-from starlette.websockets import WebSocketState
+from starlette.websockets import WebSocketDisconnect, WebSocketState
 
-from goose.chatting.api.streaming import _stream_response
+from goose.chatting.api.streaming import _accumulate_tool_chunk, _build_tool_call_from_chunk, _stream_response
 from goose.chatting.store import ConversationStore
 
 
@@ -17,8 +17,18 @@ class _FakeWebSocket:
         self.client_state = WebSocketState.CONNECTED
         self.sent_text: list[str] = []
 
-    async def send_text(self, data: str) -> None:
-        self.sent_text.append(data)
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent_text.append(data.decode())
+
+
+class _DisconnectingWebSocket:
+    def __init__(self) -> None:
+        self.client_state = WebSocketState.CONNECTED
+        self.send_attempts = 0
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.send_attempts += 1
+        raise WebSocketDisconnect()
 
 
 class _FakeAgent:
@@ -49,6 +59,23 @@ class _FakeNativeAgent:
             raise self._exc
 
 
+class _PausingNativeAgent:
+    """Yields one token, records what the client has seen after a pause, then yields another."""
+
+    def __init__(self, websocket: _FakeWebSocket, pause: float) -> None:
+        self.name = "Pausing Agent"
+        self._websocket = websocket
+        self._pause = pause
+        self.sent_before_second_token: list[str] = []
+
+    async def astream_goose(self, *, conversation: Any, messages: list[Any]) -> Any:
+        yield {"type": "token", "data": {"content": "first"}}
+        await asyncio.sleep(self._pause)
+        self.sent_before_second_token = list(self._websocket.sent_text)
+        yield {"type": "token", "data": {"content": "second"}}
+        yield {"type": "message_end", "data": {}}
+
+
 def _extract_event_types(sent_text: list[str]) -> list[str]:
     types: list[str] = []
     for raw in sent_text:
@@ -67,6 +94,18 @@ def _extract_message_types(sent_text: list[str]) -> list[str]:
     return message_types
 
 
+def test_tool_call_chunks_are_joined_across_fragments() -> None:
+    chunks: dict[int, dict[str, Any]] = {}
+    for fragment in ({"name": "look", "args": '{"q": '}, {"name": "up", "args": '"x"}', "id": "call_1"}):
+        _accumulate_tool_chunk(chunks, {"index": 0, **fragment})
+
+    tool_call = _build_tool_call_from_chunk(chunks[0])
+
+    assert tool_call.name == "lookup"
+    assert tool_call.args == {"q": "x"}
+    assert tool_call.id == "call_1"
+
+
 class TestToolFailuresAreInBand:
     def test_flushes_tool_call_then_emits_error_message(self) -> None:
         from langchain_core.messages import AIMessageChunk
@@ -137,6 +176,44 @@ class TestNativeChatProtocol:
         event_types = _extract_event_types(websocket.sent_text)
         assert event_types == ["tool_call", "tool_output", "token", "message_end"]
 
+    def test_coalesces_tokens_into_fewer_events(self) -> None:
+        store = ConversationStore()
+        conv = store.create(agent_id="a1", agent_name="Agent")
+
+        websocket = _FakeWebSocket()
+        agent = _FakeNativeAgent(
+            events=[{"type": "token", "data": {"content": "a"}} for _ in range(5)]
+            + [
+                {"type": "tool_call", "data": {"name": "list_calls", "args": {}, "id": "call_1"}},
+                {"type": "token", "data": {"content": "b"}},
+                {"type": "message_end", "data": {}},
+            ]
+        )
+
+        asyncio.run(_stream_response(websocket, agent, [], conv.id, store))
+
+        events = [json.loads(raw) for raw in websocket.sent_text]
+        contents = [event["data"]["content"] for event in events if event["type"] == "token"]
+        assert "".join(contents) == "aaaaab"
+        assert len(contents) < 6
+        assert [event["type"] for event in events][-3:] == ["tool_call", "token", "message_end"]
+
+    def test_flushes_buffered_tokens_while_the_stream_pauses(self) -> None:
+        store = ConversationStore()
+        conv = store.create(agent_id="a1", agent_name="Agent")
+
+        websocket = _FakeWebSocket()
+        agent = _PausingNativeAgent(websocket, pause=0.1)
+
+        asyncio.run(_stream_response(websocket, agent, [], conv.id, store))
+
+        assert [json.loads(raw) for raw in agent.sent_before_second_token] == [
+            {"type": "token", "data": {"content": "first"}}
+        ]
+        events = [json.loads(raw) for raw in websocket.sent_text]
+        assert [event["type"] for event in events] == ["token", "token", "message_end"]
+        assert events[1]["data"]["content"] == "second"
+
     def test_native_protocol_surfaces_exceptions_in_band(self) -> None:
         store = ConversationStore()
         conv = store.create(agent_id="a1", agent_name="Agent")
@@ -152,3 +229,17 @@ class TestNativeChatProtocol:
         updated = store.get(conv.id)
         assert updated is not None
         assert any(m.type == "error" and m.content == "native boom" for m in updated.messages)
+
+    def test_stops_sending_after_client_disconnects(self) -> None:
+        store = ConversationStore()
+        conv = store.create(agent_id="a1", agent_name="Agent")
+
+        websocket = _DisconnectingWebSocket()
+        agent = _FakeNativeAgent(events=[], exc=RuntimeError("native boom"))
+
+        asyncio.run(_stream_response(websocket, agent, [], conv.id, store))
+
+        assert websocket.send_attempts == 1
+        updated = store.get(conv.id)
+        assert updated is not None
+        assert any(m.type == "error" and m.content == "native boom" for m in updated.messages)
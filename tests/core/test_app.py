@@ -153,6 +153,16 @@ class TestGooseAppAgents:
         assert len(ids) == 2
         assert ids[0] != ids[1]
 
+    def test_agents_returns_a_fresh_list(self) -> None:
+        """Callers get their own list, so changing it leaves the app's listing intact."""
+        app = GooseApp(agents=[MockAgent(name="Agent 1")])
+
+        agents = app.agents
+        agents.append({"id": "2"})
+
+        assert isinstance(agents, list)
+        assert [a["id"] for a in app.agents] == ["1"]
+
     def test_duplicate_names_raises_error(self) -> None:
         """Duplicate agent names raise ValueError."""
         import pytest
@@ -42,6 +42,15 @@ class TestGooseConfig:
         assert config.gooseapp_dir == tmp_path / "gooseapp"
         assert config.tests_dir == tmp_path / "gooseapp" / "tests"
 
+    def test_derived_paths_follow_base_path(self, tmp_path: Path) -> None:
+        """Derived paths are recomputed when base_path changes."""
+        config = GooseConfig()
+        config.base_path = tmp_path / "first"
+        config.base_path = tmp_path / "second"
+        assert config.base_path_str == str(tmp_path / "second")
+        assert config.tests_dir == tmp_path / "second" / "gooseapp" / "tests"
+        assert config.tests_parent_str == str(tmp_path / "second" / "gooseapp")
+
     def test_class_constants(self) -> None:
         """GooseConfig has correct class constants."""
         assert GooseConfig.GOOSEAPP_DIR == "gooseapp"
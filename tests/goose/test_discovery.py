@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+import os
+import pkgutil
 import sys
+import time
 from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from goose.core.config import GooseConfig
-from goose.core.reload import _build_dependency_graph, _topological_sort, collect_submodules
+from goose.core.reload import (
+    _build_dependency_graph,
+    _topological_sort,
+    _within_any,
+    collect_submodules,
+    reload_module,
+    reload_source_modules,
+)
+from goose.testing import fixtures as fixture_registry
 from goose.testing.api.schema import TestSummary
 from goose.testing.discovery import (
     _collect_submodules_with_exclude,
+    _ensure_test_import_paths,
     _is_test_module,
     load_from_qualified_name,
+    rebind_definition,
+    reload_test_package,
 )
 from goose.testing.exceptions import TestLoadError, UnknownTestError
 from goose.testing.models.tests import TestDefinition
@@ -128,6 +143,21 @@ def test_collect_submodules_excludes_suffix(monkeypatch):
     assert set(result) == {"pkg", "pkg.test_foo"}
 
 
+def test_ensure_test_import_paths_prepends_missing_entries(monkeypatch, tmp_path):
+    """Verify missing entries are prepended once each, tests parent first."""
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    config = GooseConfig()
+    config.base_path = tmp_path
+    monkeypatch.setattr(sys, "path", ["/already/present"])
+
+    _ensure_test_import_paths(config)
+    _ensure_test_import_paths(config)
+
+    assert sys.path == [config.tests_parent_str, str(workdir), "/already/present"]
+
+
 # -----------------------------------------------------------------------------
 # _build_dependency_graph
 # -----------------------------------------------------------------------------
@@ -172,6 +202,29 @@ def test_build_dependency_graph_handles_missing_modules(monkeypatch):
     assert deps["missing.module"] == set()
 
 
+# -----------------------------------------------------------------------------
+# _within_any
+# -----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("agent", True),
+        ("agent.tools", True),
+        ("agent.tools.search", True),
+        ("agents", False),
+        ("other.agent", False),
+        ("pkg.sub", True),
+        ("pkg.sub.deep", True),
+        ("pkg.subtle", False),
+        ("pkg", False),
+    ],
+)
+def test_within_any_matches_packages_and_their_submodules(name: str, expected: bool):
+    assert _within_any(name, {"agent", "pkg.sub"}) == expected
+
+
 # -----------------------------------------------------------------------------
 # _topological_sort
 # -----------------------------------------------------------------------------
@@ -205,6 +258,24 @@ def test_topological_sort_handles_circular_dependencies():
     assert set(result) == modules
 
 
+def test_topological_sort_places_cycle_dependents_after_acyclic_modules():
+    """Modules depending on a cycle (or on unknown modules) go last, after everything that could be ordered."""
+    modules = {"base", "a", "b", "top", "orphan"}
+    deps = {
+        "base": set(),
+        "a": {"b", "base"},
+        "b": {"a"},
+        "top": {"a"},
+        "orphan": {"missing"},
+    }
+
+    result = _topological_sort(modules, deps)
+
+    assert result[0] == "base"
+    assert set(result) == modules
+    assert len(result) == len(modules)
+
+
 def test_topological_sort_handles_independent_modules():
     """Verify modules with no dependencies are all included."""
     modules = {"x", "y", "z"}
@@ -291,6 +362,116 @@ def test_two():
     assert refreshed_func() == "modified"
 
 
+def test_load_from_qualified_name_picks_up_new_modules_in_subpackages(tmp_path, monkeypatch):
+    """The cached package walk is refreshed when modules or subpackages are added."""
+    sample_root = _write_sample_tests(tmp_path)
+    _setup_test_path(monkeypatch, sample_root)
+
+    assert len(load_from_qualified_name(sample_root.name)) == 3
+
+    nested = sample_root / "nested"
+    nested.mkdir()
+    (nested / "__init__.py").write_text("", encoding="utf-8")
+    assert len(load_from_qualified_name(sample_root.name)) == 3
+
+    (nested / "test_gamma.py").write_text("def test_four():\n    return True\n", encoding="utf-8")
+    try:
+        definitions = load_from_qualified_name(sample_root.name)
+    finally:
+        for module_name in [name for name in sys.modules if name.startswith("sample_suite.nested")]:
+            del sys.modules[module_name]
+
+    assert "sample_suite.nested.test_gamma.test_four" in {definition.qualified_name for definition in definitions}
+
+
+def test_package_walk_is_cached_until_a_directory_changes(tmp_path, monkeypatch):
+    sample_root = _write_sample_tests(tmp_path)
+    _setup_test_path(monkeypatch, sample_root)
+    load_from_qualified_name(sample_root.name)
+    # Backdate the package directory so the walk counts as settled and gets cached.
+    settled = time.time() - 10
+    os.utime(sample_root, (settled, settled))
+    load_from_qualified_name(sample_root.name)
+
+    walks: list[str] = []
+    real_walk_packages = pkgutil.walk_packages
+
+    def counting_walk_packages(*args, **kwargs):
+        walks.append(args[1])
+        return real_walk_packages(*args, **kwargs)
+
+    monkeypatch.setattr(pkgutil, "walk_packages", counting_walk_packages)
+    assert len(load_from_qualified_name(sample_root.name)) == 3
+    assert walks == []
+
+    (sample_root / "test_delta.py").write_text("def test_five():\n    return True\n", encoding="utf-8")
+    try:
+        assert len(load_from_qualified_name(sample_root.name)) == 4
+    finally:
+        sys.modules.pop("sample_suite.test_delta", None)
+    assert walks == ["sample_suite."]
+
+
+def test_reload_test_package_and_rebind_pick_up_file_changes(tmp_path, monkeypatch):
+    """A single package reload refreshes previously resolved definitions."""
+    sample_root = _write_sample_tests(tmp_path)
+    _setup_test_path(monkeypatch, sample_root)
+
+    (definition,) = load_from_qualified_name("sample_suite.test_alpha.test_one")
+
+    (sample_root / "test_alpha.py").write_text('def test_one():\n    return "modified"\n', encoding="utf-8")
+    reload_test_package("sample_suite")
+
+    refreshed = rebind_definition(definition)
+    assert refreshed.qualified_name == definition.qualified_name
+    assert refreshed.func() == "modified"
+
+
+def test_rebind_fails_for_a_test_removed_after_discovery(tmp_path, monkeypatch):
+    """A test deleted between discovery and run is reported instead of running stale code."""
+    sample_root = _write_sample_tests(tmp_path)
+    _setup_test_path(monkeypatch, sample_root)
+
+    removed, kept = load_from_qualified_name("sample_suite.test_alpha")
+
+    (sample_root / "test_alpha.py").write_text("def test_two():\n    return True\n", encoding="utf-8")
+    reload_test_package("sample_suite")
+
+    with pytest.raises(TestLoadError, match="sample_suite.test_alpha.test_one"):
+        rebind_definition(removed)
+    assert rebind_definition(kept).qualified_name == kept.qualified_name
+
+
+def test_load_from_qualified_name_only_reloads_changed_test_modules(tmp_path, monkeypatch):
+    sample_root = _write_sample_tests(tmp_path)
+    _setup_test_path(monkeypatch, sample_root)
+    for name in [name for name in sys.modules if name.partition(".")[0] == "sample_suite"]:
+        monkeypatch.delitem(sys.modules, name)
+    # Backdate the suite so its mtimes count as settled once it has been loaded.
+    settled = time.time() - 10
+    for path in sample_root.iterdir():
+        os.utime(path, (settled, settled))
+    # The first load imports the suite; the second reloads it and records its mtimes.
+    load_from_qualified_name("sample_suite")
+    load_from_qualified_name("sample_suite")
+
+    reloaded: list[str] = []
+    real_reload_module = reload_module
+
+    def counting_reload_module(module_name):
+        reloaded.append(module_name)
+        real_reload_module(module_name)
+
+    monkeypatch.setattr("goose.core.reload.reload_module", counting_reload_module)
+    assert len(load_from_qualified_name("sample_suite")) == 3
+    assert reloaded == []
+
+    (sample_root / "test_alpha.py").write_text('def test_one():\n    return "modified"\n', encoding="utf-8")
+    (definition,) = load_from_qualified_name("sample_suite.test_alpha.test_one")
+    assert definition.func() == "modified"
+    assert "sample_suite.test_alpha" in reloaded
+
+
 def test_load_from_qualified_name_does_not_duplicate_fixtures_on_reload(tmp_path, monkeypatch):
     """Calling load_from_qualified_name multiple times should not cause duplicate fixture registration."""
     sample_root = _write_sample_tests(tmp_path)
@@ -309,6 +490,37 @@ def test_load_from_qualified_name_does_not_duplicate_fixtures_on_reload(tmp_path
     assert len(definitions) == 3
 
 
+def test_fixtures_from_unchanged_test_modules_survive_a_reload(tmp_path, monkeypatch):
+    """Test modules skipped by the mtime gate keep the fixtures they registered at import."""
+    sample_root = _write_sample_tests(tmp_path)
+    (sample_root / "test_gamma.py").write_text(
+        "from goose.testing import fixture\n\n@fixture()\ndef local_value():\n    return 7\n\n"
+        "def test_four(local_value):\n    return local_value\n",
+        encoding="utf-8",
+    )
+    _setup_test_path(monkeypatch, sample_root)
+    for name in [name for name in sys.modules if name.partition(".")[0] == "sample_suite"]:
+        monkeypatch.delitem(sys.modules, name)
+    settled = time.time() - 10
+    for path in sample_root.iterdir():
+        os.utime(path, (settled, settled))
+    load_from_qualified_name("sample_suite")
+    load_from_qualified_name("sample_suite")
+
+    reloaded: list[str] = []
+    real_reload_module = reload_module
+
+    def counting_reload_module(module_name):
+        reloaded.append(module_name)
+        real_reload_module(module_name)
+
+    monkeypatch.setattr("goose.core.reload.reload_module", counting_reload_module)
+    load_from_qualified_name("sample_suite")
+
+    assert reloaded == []
+    assert set(fixture_registry.fixtures) == {"goose", "local_value"}
+
+
 def test_load_from_qualified_name_reloads_source_targets(tmp_path, monkeypatch):
     """Verify that reload targets are reloaded before discovering tests."""
     sample_root = _write_sample_tests(tmp_path)
@@ -347,6 +559,41 @@ def test_load_from_qualified_name_reloads_source_targets(tmp_path, monkeypatch):
                 del sys.modules[name]
 
 
+def test_reload_source_modules_only_if_changed_skips_unmodified_sources(tmp_path, monkeypatch):
+    """The mtime gate skips reloading until a source file is modified."""
+    source_pkg = tmp_path / "gated_source"
+    source_pkg.mkdir()
+    (source_pkg / "__init__.py").write_text("", encoding="utf-8")
+    tools_file = source_pkg / "tools.py"
+    tools_file.write_text("VALUE = 1\n", encoding="utf-8")
+    # Backdate the sources so their mtimes count as settled and are recorded.
+    settled = time.time() - 10
+    for path in (source_pkg / "__init__.py", tools_file):
+        os.utime(path, (settled, settled))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(GooseConfig, "refresh_app", lambda self: None)
+
+    try:
+        import gated_source.tools as tools_module
+
+        config = GooseConfig()
+        config.reload_targets = ["gated_source"]
+        reload_source_modules(only_if_changed=True)
+
+        tools_module.VALUE = 2
+        reload_source_modules(only_if_changed=True)
+        assert tools_module.VALUE == 2
+
+        tools_file.write_text("VALUE = 3\n", encoding="utf-8")
+        os.utime(tools_file, ns=(tools_file.stat().st_atime_ns, tools_file.stat().st_mtime_ns + 1_000_000_000))
+        reload_source_modules(only_if_changed=True)
+        assert sys.modules["gated_source.tools"].VALUE == 3
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("gated_source"):
+                del sys.modules[name]
+
+
 # -----------------------------------------------------------------------------
 # TestSummary
 # -----------------------------------------------------------------------------
@@ -380,6 +627,32 @@ def test_test_summary_handles_no_docstring():
     assert summary.docstring is None
 
 
+def test_test_summary_is_reused_until_function_changes():
+    def first_case():
+        """First version."""
+
+    def second_case():
+        """Second version."""
+
+    first = TestDefinition(module="pkg.tests", name="test_cached", func=first_case)
+    summary = TestSummary.from_definition(first)
+
+    assert TestSummary.from_definition(TestDefinition(module="pkg.tests", name="test_cached", func=first_case)) is summary
+
+    reloaded = TestSummary.from_definition(TestDefinition(module="pkg.tests", name="test_cached", func=second_case))
+    assert reloaded.docstring == "Second version."
+
+
+def test_cached_test_summary_is_immutable():
+    def sample_case():
+        """Shared summary."""
+
+    summary = TestSummary.from_definition(TestDefinition(module="pkg.tests", name="test_frozen", func=sample_case))
+
+    with pytest.raises(ValidationError):
+        summary.docstring = "changed"
+
+
 # -----------------------------------------------------------------------------
 # Import error propagation
 # -----------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 from unittest import mock
 
 import pytest
@@ -74,6 +75,23 @@ def test_build_call_arguments_resolves_dependencies():
     assert cache["dependency"] == "dep"
 
 
+def test_signatures_are_built_once_per_function(monkeypatch):
+    @fixture()
+    def dependency():
+        return "dep"
+
+    def target(dependency: str):
+        return dependency
+
+    signature = mock.Mock(wraps=inspect.signature)
+    monkeypatch.setattr("goose.testing.fixtures.inspect.signature", signature)
+
+    for _ in range(3):
+        assert build_call_arguments(target, {}) == {"dependency": "dep"}
+
+    signature.assert_called_once_with(target)
+
+
 def test_fixture_resolution_detects_cycles():
     @fixture()
     def first(second):  # type: ignore[no-redef]
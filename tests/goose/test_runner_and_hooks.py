@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
+import weakref
+from datetime import date
 from unittest import mock
 
-from goose.testing.engine import Goose
+import pytest
+
+from goose.testing.engine import Goose, _shared_validator
 from goose.testing.hooks import TestLifecycleHooks
-from goose.testing.models.messages import AgentResponse, Message
+from goose.testing.models.messages import AgentResponse, Message, ToolCall
 from goose.testing.models.tests import TestDefinition, TestResult
+from goose.testing.output import _palette, display_result, display_summary, run_tests
 from goose.testing.runner import execute_test
+from goose.testing.test_case import TestCase
 
 
 def _definition() -> TestDefinition:
@@ -52,7 +61,6 @@ def test_execute_test_runs_hooks_and_returns_result(monkeypatch):
     monkeypatch.setattr("goose.testing.runner.apply_autouse", lambda cache: None)
 
     definition = _definition()
-    monkeypatch.setattr("goose.testing.runner.load_from_qualified_name", lambda name: [definition])
     result = execute_test(definition)
 
     assert isinstance(result, TestResult)
@@ -71,7 +79,6 @@ def test_execute_test_captures_exceptions(monkeypatch):
         lambda cache: mock.Mock(hooks=TestLifecycleHooks(), consume_test_case=lambda: None),
     )
     monkeypatch.setattr("goose.testing.runner.apply_autouse", lambda cache: None)
-    monkeypatch.setattr("goose.testing.runner.load_from_qualified_name", lambda name: [definition])
 
     result = execute_test(definition)
 
@@ -79,6 +86,28 @@ def test_execute_test_captures_exceptions(monkeypatch):
     assert result.error_type is not None
 
 
+def test_failed_result_keeps_the_traceback_text_but_not_the_test_locals():
+    class Payload:
+        pass
+
+    payload_ref: list[weakref.ref] = []
+
+    def failing_test():
+        payload = Payload()
+        payload_ref.append(weakref.ref(payload))
+        raise RuntimeError("boom")
+
+    definition = TestDefinition(module="pkg.tests", name="test_fail", func=failing_test)
+    try:
+        failing_test()
+    except RuntimeError as exc:
+        result = TestResult(definition=definition, duration=0.0, exception=exc)
+
+    assert "failing_test" in result.error_message
+    assert "RuntimeError: boom" in result.error_message
+    assert payload_ref[0]() is None
+
+
 def test_goose_case_initializes_validator_only_during_evaluation(monkeypatch):
     validator_instance = mock.Mock()
     validator_instance.evaluate.return_value = mock.Mock(
@@ -88,6 +117,7 @@ def test_goose_case_initializes_validator_only_during_evaluation(monkeypatch):
     )
     validator_cls = mock.Mock(return_value=validator_instance)
     monkeypatch.setattr("goose.testing.engine.AgentValidator", validator_cls)
+    monkeypatch.setattr("goose.testing.engine._thread_validators", threading.local())
 
     response = AgentResponse(messages=[Message(type="ai", content="hello")])
     goose = Goose(agent_query_func=lambda query: response)
@@ -96,5 +126,218 @@ def test_goose_case_initializes_validator_only_during_evaluation(monkeypatch):
 
     goose.case(query="hi", expectations=["Responded"], expected_tool_calls=None)
 
-    validator_cls.assert_called_once_with(chat_model="gpt-4o-mini")
+    validator_cls.assert_called_once_with(chat_model="gpt-4o-mini", current_date=date.today())
     validator_instance.evaluate.assert_called_once_with(agent_output=response, expectations=["Responded"])
+
+
+def test_goose_case_without_expectations_skips_the_validator(monkeypatch):
+    validator_cls = mock.Mock()
+    monkeypatch.setattr("goose.testing.engine.AgentValidator", validator_cls)
+    monkeypatch.setattr("goose.testing.engine._thread_validators", threading.local())
+
+    response = AgentResponse(messages=[Message(type="ai", tool_calls=[ToolCall(name="search")])])
+    goose = Goose(agent_query_func=lambda query: response)
+    goose.case(query="hi", expectations=[], expected_tool_calls=["search"])
+
+    validator_cls.assert_not_called()
+    assert goose.consume_test_case().last_response is response
+
+
+def test_goose_instances_share_the_validator_for_a_model_name(monkeypatch):
+    validator_cls = mock.Mock()
+    monkeypatch.setattr("goose.testing.engine.AgentValidator", validator_cls)
+    monkeypatch.setattr("goose.testing.engine._thread_validators", threading.local())
+
+    first = Goose(agent_query_func=lambda query: None)._get_validation_agent()
+    second = Goose(agent_query_func=lambda query: None)._get_validation_agent()
+    chat_model = mock.Mock()
+    Goose(agent_query_func=lambda query: None, validator_model=chat_model)._get_validation_agent()
+
+    assert first is second
+    assert validator_cls.call_args_list == [
+        mock.call(chat_model="gpt-4o-mini", current_date=date.today()),
+        mock.call(chat_model=chat_model),
+    ]
+
+
+def test_threads_do_not_share_a_validator(monkeypatch):
+    validator_cls = mock.Mock(side_effect=lambda **kwargs: mock.Mock())
+    monkeypatch.setattr("goose.testing.engine.AgentValidator", validator_cls)
+    monkeypatch.setattr("goose.testing.engine._thread_validators", threading.local())
+
+    validators = []
+
+    def get_validator() -> None:
+        validators.append(Goose(agent_query_func=lambda query: None)._get_validation_agent())
+
+    thread = threading.Thread(target=get_validator)
+    thread.start()
+    thread.join()
+    get_validator()
+    get_validator()
+
+    assert validators[0] is not validators[1]
+    assert validators[1] is validators[2]
+
+
+def test_shared_validator_is_rebuilt_for_a_new_day(monkeypatch):
+    validator_cls = mock.Mock(side_effect=lambda **kwargs: mock.Mock())
+    monkeypatch.setattr("goose.testing.engine.AgentValidator", validator_cls)
+    monkeypatch.setattr("goose.testing.engine._thread_validators", threading.local())
+
+    first = _shared_validator("gpt-4o-mini", date(2026, 1, 1))
+    same_day = _shared_validator("gpt-4o-mini", date(2026, 1, 1))
+    next_day = _shared_validator("gpt-4o-mini", date(2026, 1, 2))
+
+    assert first is same_day
+    assert next_day is not first
+    assert validator_cls.call_args_list[-1] == mock.call(chat_model="gpt-4o-mini", current_date=date(2026, 1, 2))
+
+
+def test_run_tests_runs_concurrently_and_reports_every_result(monkeypatch):
+    definitions = [TestDefinition(module="pkg.tests", name=f"test_{index}", func=lambda: None) for index in range(3)]
+    # Every test waits for the others, so the run only completes if they execute concurrently.
+    barrier = threading.Barrier(len(definitions), timeout=5)
+
+    def fake_execute_test(definition):
+        barrier.wait()
+        return TestResult(definition=definition, duration=1.0, test_case=None, exception=None)
+
+    stored: list[str] = []
+    store = mock.Mock(add_run=lambda job_id, result: stored.append(result.name))
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute_test)
+
+    passed, failures, total_duration = run_tests(definitions, verbose=False, store=store, jobs=3)
+
+    assert (passed, failures, total_duration) == (3, 0, 3.0)
+    assert sorted(stored) == ["test_0", "test_1", "test_2"]
+
+
+def test_run_tests_reports_results_as_they_complete(monkeypatch):
+    definitions = [TestDefinition(module="pkg.tests", name=f"test_{index}", func=lambda: None) for index in range(2)]
+    second_reported = threading.Event()
+
+    def fake_execute_test(definition):
+        if definition.name == "test_0":
+            # The first test only finishes once the second one has been reported.
+            assert second_reported.wait(timeout=5)
+        return TestResult(definition=definition, duration=0.0, test_case=None, exception=None)
+
+    def add_run(job_id, result):
+        if result.name == "test_1":
+            second_reported.set()
+
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute_test)
+
+    assert run_tests(definitions, verbose=False, store=mock.Mock(add_run=add_run), jobs=2) == (2, 0, 0.0)
+
+
+def test_run_tests_stops_submitting_after_an_error(monkeypatch):
+    definitions = [TestDefinition(module="pkg.tests", name=f"test_{index}", func=lambda: None) for index in range(20)]
+    executed: list[str] = []
+
+    def fake_execute_test(definition):
+        executed.append(definition.name)
+        if definition.name == "test_0":
+            raise RuntimeError("fixture failed")
+        time.sleep(0.05)
+        return TestResult(definition=definition, duration=0.0, test_case=None, exception=None)
+
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute_test)
+
+    with pytest.raises(RuntimeError, match="fixture failed"):
+        run_tests(definitions, verbose=False, jobs=2)
+
+    assert len(executed) <= 4
+
+
+def test_display_result_is_plain_when_stdout_is_not_a_terminal(capsys):
+    definition = TestDefinition(module="pkg.tests", name="test_fail", func=lambda: None)
+    result = TestResult(definition=definition, duration=1.5, test_case=None, exception=RuntimeError("boom"))
+
+    _palette.cache_clear()
+    try:
+        assert display_result(result, verbose=False) == 1
+    finally:
+        _palette.cache_clear()
+
+    output = capsys.readouterr().out
+    assert "\x1b" not in output
+    assert output.splitlines()[0] == "FAIL pkg.tests.test_fail (1.50s)"
+    assert "boom" in output
+
+
+def test_run_tests_writes_one_json_record_per_result(monkeypatch, capsys):
+    definitions = [TestDefinition(module="pkg.tests", name=f"test_{index}", func=lambda: None) for index in range(2)]
+
+    def fake_execute_test(definition):
+        exception = None
+        if definition.name == "test_1":
+            exception = RuntimeError("boom")
+        return TestResult(definition=definition, duration=0.5, test_case=None, exception=exception)
+
+    stored: list[object] = []
+    store = mock.Mock(add_run=lambda job_id, result: stored.append(result))
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute_test)
+
+    assert run_tests(definitions, verbose=True, store=store, json_lines=True) == (1, 1, 1.0)
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(record["qualified_name"], record["passed"]) for record in records] == [
+        ("pkg.tests.test_0", True),
+        ("pkg.tests.test_1", False),
+    ]
+    assert "boom" in records[1]["error"]
+    assert [result.model_dump(mode="json") for result in stored] == records
+
+
+def test_display_summary_writes_a_single_plain_line(capsys):
+    _palette.cache_clear()
+    try:
+        display_summary(3, 1, 2.5)
+    finally:
+        _palette.cache_clear()
+
+    assert capsys.readouterr().out == "3 passed, 1 failed (2.50s)\n"
+
+
+def test_run_tests_exitfirst_stops_after_the_first_failure(monkeypatch):
+    definitions = [TestDefinition(module="pkg.tests", name=f"test_{index}", func=lambda: None) for index in range(4)]
+    executed: list[str] = []
+
+    def fake_execute_test(definition):
+        executed.append(definition.name)
+        exception = None
+        if definition.name == "test_1":
+            exception = RuntimeError("boom")
+        return TestResult(definition=definition, duration=0.5, test_case=None, exception=exception)
+
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute_test)
+
+    assert run_tests(definitions, verbose=False, exitfirst=True) == (1, 1, 1.0)
+    assert executed == ["test_0", "test_1"]
+
+
+def test_display_result_pretty_prints_tool_payloads_in_verbose_mode(capsys):
+    test_case = TestCase(query_message="hi", expectations=[])
+    test_case.last_response = AgentResponse(
+        messages=[
+            Message(type="human", content="hi"),
+            Message(type="ai", tool_calls=[ToolCall(name="search", args={"query": "goose", "limit": 2})]),
+            Message(type="tool", tool_name="search", content='{"hits": [1]}'),
+            Message(type="tool", tool_name="search", content="not json"),
+        ]
+    )
+    definition = TestDefinition(module="pkg.tests", name="test_tools", func=lambda: None)
+    result = TestResult(definition=definition, duration=0.1, test_case=test_case, exception=None)
+
+    _palette.cache_clear()
+    try:
+        assert display_result(result, verbose=True) == 0
+    finally:
+        _palette.cache_clear()
+
+    output = capsys.readouterr().out
+    assert '{\n  "query": "goose",\n  "limit": 2\n}' in output
+    assert '{\n  "hits": [\n    1\n  ]\n}' in output
+    assert "not json" in output
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sys
+
+from goose.testing import test_case as test_case_module
 from goose.testing.errors import ExpectationValidationError, ToolCallValidationError
 from goose.testing.test_case import TestCase
 
@@ -24,6 +27,24 @@ def test_validate_tool_calls_allows_extra_tools():
     case.validate_tool_calls(actual_tool_call_names=["search", "lookup"])
 
 
+def test_expected_tool_call_names_are_resolved_once(monkeypatch):
+    calls: list[object] = []
+    extract = test_case_module._extract_expected_tool_call_name
+
+    def counting_extract(item):
+        calls.append(item)
+        return extract(item)
+
+    monkeypatch.setattr(test_case_module, "_extract_expected_tool_call_name", counting_extract)
+    case = TestCase(query_message="hello", expectations=["say hi"], expected_tool_calls=[" search ", "lookup"])
+
+    for _ in range(3):
+        case.validate_tool_calls(actual_tool_call_names=["lookup", "search"])
+    assert case.expected_tool_call_names == ["search", "lookup"]
+    assert calls == [" search ", "lookup"]
+    assert case.expected_tool_call_names[0] is sys.intern("search")
+
+
 def test_validate_tool_calls_raises_when_mismatch():
     case = make_case()
     case.expected_tool_calls = [type("Tool", (), {"name": "search"})()]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -28,6 +29,15 @@ class TestCLIStructure:
         assert "api" in result.output
         assert "test" in result.output
 
+    def test_importing_cli_does_not_load_server_or_agent_stack(self) -> None:
+        """`goose --help` and `goose init` should not pay for the server or the LangChain agent runtime."""
+        heavy = ("uvicorn", "fastapi", "goose.app", "langchain.agents", "langgraph")
+        code = f"import sys, goose.cli; print([m for m in sys.modules if m.startswith({heavy!r})])"
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
+
     def test_test_subcommand_has_run_and_list(self) -> None:
         """Test subcommand has run and list commands."""
         result = runner.invoke(app, ["test", "--help"])
@@ -51,6 +61,14 @@ class TestGooseInit:
         assert (tmp_path / "gooseapp" / "tests").exists()
         assert (tmp_path / "gooseapp" / "tests" / "__init__.py").exists()
 
+    def test_init_skips_template_bytecode(self, tmp_path: Path) -> None:
+        """goose init copies template sources only, never compiled bytecode."""
+        result = runner.invoke(app, ["init", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert not list((tmp_path / "gooseapp").rglob("__pycache__"))
+        assert "├── tests/test_example.py" in result.output
+
     def test_init_app_py_contains_gooseapp(self, tmp_path: Path) -> None:
         """Generated app.py imports GooseApp."""
         runner.invoke(app, ["init", str(tmp_path)])
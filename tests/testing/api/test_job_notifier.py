@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+from goose.testing.api.jobs.enums import JobStatus
+from goose.testing.api.jobs.job_notifier import BroadcastRing, JobNotifier
+from goose.testing.api.jobs.models import Job
+
+
+def _make_job(status: JobStatus, job_id: str = "job-1") -> Job:
+    now = datetime.now(timezone.utc)
+    return Job(id=job_id, status=status, targets=[], created_at=now, updated_at=now)
+
+
+def _encode(job: Job) -> bytes:
+    return f"{job.id}:{job.status.value}".encode()
+
+
+def test_publish_coalesces_intermediate_snapshots() -> None:
+    async def scenario() -> list[bytes] | None:
+        notifier = JobNotifier(_encode, flush_interval=0.01)
+        subscription = notifier.subscribe()
+        for _ in range(5):
+            await asyncio.to_thread(notifier.publish, _make_job(JobStatus.RUNNING))
+        await asyncio.sleep(0.05)
+        return await subscription.receive()
+
+    delivered = asyncio.run(scenario())
+
+    assert delivered == [b"job-1:running"]
+
+
+def test_publish_keeps_latest_snapshot_per_job() -> None:
+    async def scenario() -> list[bytes] | None:
+        notifier = JobNotifier(_encode, flush_interval=0.01)
+        subscription = notifier.subscribe()
+        notifier.publish(_make_job(JobStatus.QUEUED, job_id="first"))
+        notifier.publish(_make_job(JobStatus.QUEUED, job_id="second"))
+        notifier.publish(_make_job(JobStatus.RUNNING, job_id="first"))
+        await asyncio.sleep(0.05)
+        return await subscription.receive()
+
+    delivered = asyncio.run(scenario())
+
+    assert delivered == [b"first:running", b"second:queued"]
+
+
+def test_terminal_snapshot_flushes_immediately() -> None:
+    async def scenario() -> list[bytes] | None:
+        notifier = JobNotifier(_encode, flush_interval=60.0)
+        subscription = notifier.subscribe()
+        notifier.publish(_make_job(JobStatus.RUNNING))
+        notifier.publish(_make_job(JobStatus.SUCCEEDED))
+        return await asyncio.wait_for(subscription.receive(), timeout=1.0)
+
+    delivered = asyncio.run(scenario())
+
+    assert delivered == [b"job-1:succeeded"]
+
+
+def test_terminal_snapshot_is_not_overtaken_by_an_in_flight_timer_flush() -> None:
+    encoding_running = threading.Event()
+    release_running = threading.Event()
+
+    def encode(job: Job) -> bytes:
+        if job.status is JobStatus.RUNNING:
+            encoding_running.set()
+            assert release_running.wait(timeout=5)
+        return _encode(job)
+
+    async def scenario() -> list[bytes] | None:
+        notifier = JobNotifier(encode, flush_interval=60.0)
+        subscription = notifier.subscribe()
+        notifier.publish(_make_job(JobStatus.RUNNING))
+
+        # The timer flush takes the RUNNING snapshot and is still encoding it when the
+        # worker publishes the terminal snapshot, which flushes on the worker thread.
+        timer_flush = asyncio.create_task(asyncio.to_thread(notifier._flush))
+        assert await asyncio.to_thread(encoding_running.wait, 5)
+        terminal_publish = asyncio.create_task(asyncio.to_thread(notifier.publish, _make_job(JobStatus.SUCCEEDED)))
+        await asyncio.sleep(0.05)
+        release_running.set()
+        await asyncio.gather(timer_flush, terminal_publish)
+        return await subscription.receive()
+
+    delivered = asyncio.run(scenario())
+
+    assert delivered == [b"job-1:running", b"job-1:succeeded"]
+
+
+def test_subscribers_share_encoded_payloads() -> None:
+    encoded: list[Job] = []
+
+    def encode(job: Job) -> bytes:
+        encoded.append(job)
+        return _encode(job)
+
+    async def scenario() -> tuple[list[bytes] | None, list[bytes] | None]:
+        notifier = JobNotifier(encode)
+        first = notifier.subscribe()
+        second = notifier.subscribe()
+        notifier.publish(_make_job(JobStatus.FAILED))
+        return await first.receive(), await second.receive()
+
+    first_payloads, second_payloads = asyncio.run(scenario())
+
+    assert first_payloads == second_payloads == [b"job-1:failed"]
+    assert len(encoded) == 1
+
+
+def test_ring_reports_readers_that_fell_behind() -> None:
+    ring = BroadcastRing(maxlen=2)
+    cursor = ring.head
+    ring.extend([b"a", b"b", b"c"])
+
+    payloads, cursor = ring.read_from(cursor)
+    assert payloads is None
+
+    ring.extend([b"d"])
+    payloads, cursor = ring.read_from(cursor)
+    assert payloads == [b"d"]
+    assert cursor == ring.head
+
+
+def test_released_subscriptions_are_dropped() -> None:
+    async def scenario() -> bool:
+        notifier = JobNotifier(_encode)
+        subscription = notifier.subscribe()
+        assert notifier.has_subscribers
+        del subscription
+        return notifier.has_subscribers
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_unsubscribed_subscriptions_stop_counting_as_listeners() -> None:
+    async def scenario() -> bool:
+        notifier = JobNotifier(_encode)
+        subscription = notifier.subscribe()
+        notifier.unsubscribe(subscription)
+        return notifier.has_subscribers
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_publish_skips_subscribers_whose_loop_is_closed() -> None:
+    notifier = JobNotifier(_encode, flush_interval=0.01)
+
+    async def subscribe():
+        return notifier.subscribe()
+
+    closed_loop = asyncio.new_event_loop()
+    stale = closed_loop.run_until_complete(subscribe())
+    closed_loop.close()
+    # With only the stale subscriber left there is no loop to schedule on; this must not raise.
+    notifier.publish(_make_job(JobStatus.RUNNING, job_id="job-0"))
+
+    async def scenario() -> tuple[list[bytes] | None, list[bytes] | None]:
+        subscription = notifier.subscribe()
+        await asyncio.to_thread(notifier.publish, _make_job(JobStatus.RUNNING))
+        first = await asyncio.wait_for(subscription.receive(), timeout=1)
+        await asyncio.to_thread(notifier.publish, _make_job(JobStatus.RUNNING, job_id="job-2"))
+        second = await asyncio.wait_for(subscription.receive(), timeout=1)
+        return first, second
+
+    assert asyncio.run(scenario()) == ([b"job-1:running"], [b"job-2:running"])
+    assert stale.loop.is_closed()
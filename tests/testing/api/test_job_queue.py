@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import threading
 from collections import deque
 
+import pytest
+
 from goose.testing.api.jobs.enums import JobStatus, TestStatus
 from goose.testing.api.jobs.job_queue import JobQueue
 from goose.testing.api.jobs.state import JobStore
 from goose.testing.models.tests import TestDefinition, TestResult
 
 
+@pytest.fixture(autouse=True)
+def run_definitions_as_queued(monkeypatch) -> None:
+    """The helper definitions live in no real module, so they are run as queued instead of rebound."""
+    monkeypatch.setattr("goose.testing.api.jobs.job_queue.rebind_definition", lambda definition: definition)
+
+
 def _make_definition(name: str = "test_case") -> TestDefinition:
     def _case() -> None:  # pragma: no cover - helper only
         return None
@@ -22,7 +31,8 @@ def test_job_queue_runs_targets_to_completion(monkeypatch) -> None:
     def fake_execute(definition: TestDefinition) -> TestResult:
         return TestResult(definition=definition, duration=0.05, test_case=None, exception=None)
 
-    monkeypatch.setattr("goose.testing.api.jobs.job_queue.execute_test", fake_execute)
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute)
+    monkeypatch.setattr("goose.testing.api.jobs.job_queue.reload_test_package", lambda root_package: None)
 
     queue = JobQueue(on_job_update=lambda job: updates.append(job.status), job_store=store)
     definition = _make_definition()
@@ -45,7 +55,8 @@ def test_job_queue_marks_job_failed_on_exception(monkeypatch) -> None:
     def failing_execute(definition: TestDefinition) -> TestResult:  # pragma: no cover - exercised via exception
         raise RuntimeError(f"boom: {definition.qualified_name}")
 
-    monkeypatch.setattr("goose.testing.api.jobs.job_queue.execute_test", failing_execute)
+    monkeypatch.setattr("goose.testing.runner.execute_test", failing_execute)
+    monkeypatch.setattr("goose.testing.api.jobs.job_queue.reload_test_package", lambda root_package: None)
 
     queue = JobQueue(job_store=store)
     definition = _make_definition("failure")
@@ -56,5 +67,88 @@ def test_job_queue_marks_job_failed_on_exception(monkeypatch) -> None:
     snapshot = store.get_job(job.id)
     assert snapshot is not None
     assert snapshot.status == JobStatus.FAILED
-    assert snapshot.error is not None and "boom" in snapshot.error
+    assert snapshot.error is not None and "boom" in snapshot.error.text
     assert snapshot.test_statuses[definition.qualified_name] == TestStatus.FAILED
+
+
+def test_job_queue_reloads_test_package_once_per_job(monkeypatch) -> None:
+    store = JobStore()
+    reloaded: list[str] = []
+
+    def fake_execute(definition: TestDefinition) -> TestResult:
+        return TestResult(definition=definition, duration=0.0, test_case=None, exception=None)
+
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute)
+    monkeypatch.setattr("goose.testing.api.jobs.job_queue.reload_test_package", reloaded.append)
+
+    queue = JobQueue(job_store=store)
+    job = queue.enqueue([_make_definition("first"), _make_definition("second"), _make_definition("third")])
+    queue._queue.join()  # type: ignore[attr-defined]
+
+    snapshot = store.get_job(job.id)
+    assert snapshot is not None
+    assert snapshot.status == JobStatus.SUCCEEDED
+    assert reloaded == ["pkg"]
+
+
+def test_job_queue_skips_snapshots_without_listeners(monkeypatch) -> None:
+    store = JobStore()
+    updates: list[JobStatus] = []
+
+    def fake_execute(definition: TestDefinition) -> TestResult:
+        return TestResult(definition=definition, duration=0.0, test_case=None, exception=None)
+
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute)
+    monkeypatch.setattr("goose.testing.api.jobs.job_queue.reload_test_package", lambda root_package: None)
+
+    queue = JobQueue(on_job_update=lambda job: updates.append(job.status), has_listeners=lambda: False, job_store=store)
+    job = queue.enqueue([_make_definition()])
+    queue._queue.join()  # type: ignore[attr-defined]
+
+    snapshot = store.get_job(job.id)
+    assert snapshot is not None
+    assert snapshot.status == JobStatus.SUCCEEDED
+    assert updates == []
+
+
+def test_job_queue_runs_tests_concurrently_and_keeps_target_order(monkeypatch) -> None:
+    store = JobStore()
+    # Every test waits for the others, so the job only completes if they execute concurrently.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_execute(definition: TestDefinition) -> TestResult:
+        barrier.wait()
+        return TestResult(definition=definition, duration=0.0, test_case=None, exception=None)
+
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute)
+    monkeypatch.setattr("goose.testing.api.jobs.job_queue.reload_test_package", lambda root_package: None)
+
+    queue = JobQueue(job_store=store, max_concurrency=3)
+    names = ["first", "second", "third"]
+    job = queue.enqueue([_make_definition(name) for name in names])
+    queue._queue.join()  # type: ignore[attr-defined]
+
+    snapshot = store.get_job(job.id)
+    assert snapshot is not None
+    assert snapshot.status == JobStatus.SUCCEEDED
+    assert [result.definition.name for result in snapshot.results] == names
+
+
+def test_job_queue_reuses_worker_threads_across_jobs(monkeypatch) -> None:
+    store = JobStore()
+    threads: set[threading.Thread] = set()
+
+    def fake_execute(definition: TestDefinition) -> TestResult:
+        threads.add(threading.current_thread())
+        return TestResult(definition=definition, duration=0.0, test_case=None, exception=None)
+
+    monkeypatch.setattr("goose.testing.runner.execute_test", fake_execute)
+    monkeypatch.setattr("goose.testing.api.jobs.job_queue.reload_test_package", lambda root_package: None)
+
+    queue = JobQueue(job_store=store, max_concurrency=2)
+    for _ in range(3):
+        queue.enqueue([_make_definition("first"), _make_definition("second")])
+    queue._queue.join()  # type: ignore[attr-defined]
+
+    assert 1 <= len(threads) <= 2
+    assert all(thread.name.startswith("GooseTestWorker") for thread in threads)
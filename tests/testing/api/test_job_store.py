@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import traceback
 from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
+from unittest import mock
 
 from goose.testing.api.jobs.enums import JobStatus, TestStatus
+from goose.testing.api.jobs.models import TEST_STATUS_CODES
 from goose.testing.api.jobs.state import JobStore
 from goose.testing.models.tests import TestDefinition, TestResult
 
@@ -33,9 +36,9 @@ def test_get_job_returns_copy() -> None:
 
     fetched = store.get_job(job.id)
     assert fetched is not None
-    fetched.test_statuses[definition.qualified_name] = TestStatus.FAILED
+    fetched.status_codes[0] = TEST_STATUS_CODES[TestStatus.FAILED]
 
-    # Original should remain untouched because fetch returns a deepcopy
+    # Original should remain untouched because fetch returns a copy
     original = store.get_job(job.id)
     assert original is not None
     assert original.test_statuses[definition.qualified_name] == TestStatus.QUEUED
@@ -92,18 +95,66 @@ def test_mark_failed_records_error() -> None:
     definition = _make_definition()
     job = store.create_job(targets=[definition])
 
-    snapshot = store.mark_failed(job.id, "boom")
+    error = traceback.TracebackException.from_exception(RuntimeError("boom"))
+    snapshot = store.mark_failed(job.id, error)
     assert snapshot is not None
     assert snapshot.status == JobStatus.FAILED
-    assert snapshot.error == "boom"
+    assert snapshot.error is not None
+    assert snapshot.error.text == "RuntimeError: boom\n"
     assert snapshot.test_statuses[definition.qualified_name] == TestStatus.FAILED
 
 
+def test_failed_job_snapshots_share_one_rendered_error() -> None:
+    store = JobStore()
+    job = store.create_job(targets=[_make_definition()])
+    error = traceback.TracebackException.from_exception(RuntimeError("boom"))
+    store.mark_failed(job.id, error)
+
+    first = store.get_job(job.id)
+    second = store.get_job(job.id)
+    assert first is not None and second is not None
+    assert first.error is second.error
+    with mock.patch.object(traceback.TracebackException, "format", wraps=error.format) as format_spy:
+        assert first.error.text == second.error.text == "RuntimeError: boom\n"
+    format_spy.assert_called_once()
+
+
 def test_update_test_status_overrides_single_entry() -> None:
     store = JobStore()
     definition = _make_definition()
     job = store.create_job(targets=[definition])
 
-    updated = store.update_test_status(job.id, definition.qualified_name, TestStatus.RUNNING)
+    updated = store.update_test_status(job.id, 0, TestStatus.RUNNING)
     assert updated is not None
     assert updated.test_statuses[definition.qualified_name] == TestStatus.RUNNING
+
+
+def test_snapshots_share_results_but_copy_containers() -> None:
+    store = JobStore()
+    definition = _make_definition()
+    job = store.create_job(targets=[definition])
+    result = TestResult(definition=definition, duration=0.1, test_case=None, exception=None)
+
+    snapshot = store.add_test_result(job.id, 0, result)
+    assert snapshot is not None
+    snapshot.results.clear()
+
+    fetched = store.get_job(job.id)
+    assert fetched is not None
+    assert fetched.results[0] is result
+    assert fetched.targets[0] is definition
+
+
+def test_status_codes_track_duplicate_targets_by_position() -> None:
+    store = JobStore()
+    definition = _make_definition()
+    job = store.create_job(targets=[definition, definition])
+    failed = TestResult(definition=definition, duration=0.1, test_case=None, exception=RuntimeError("boom"))
+
+    store.mark_running(job.id)
+    snapshot = store.add_test_result(job.id, 0, failed)
+    assert snapshot is not None
+    assert list(snapshot.status_codes) == [
+        TEST_STATUS_CODES[TestStatus.FAILED],
+        TEST_STATUS_CODES[TestStatus.QUEUED],
+    ]
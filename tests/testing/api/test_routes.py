@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import importlib
+import traceback
 from datetime import datetime, timezone
 
 from fastapi.testclient import TestClient
 
 from goose.app import app
 from goose.testing.api.jobs.enums import JobStatus, TestStatus
-from goose.testing.api.jobs.models import Job
+from goose.testing.api.jobs.models import TEST_STATUS_CODES, Job, JobError
+from goose.testing.api.schema import JobResource, TestResultModel
+from goose.testing.exceptions import TestLoadError, UnknownTestError
 from goose.testing.models.tests import TestDefinition
 
 # Import the router module (not the router object) for monkeypatching
@@ -34,7 +37,7 @@ def _make_job(status: JobStatus = JobStatus.QUEUED) -> Job:
         updated_at=now,
         results=[],
         error=None,
-        test_statuses={definition.qualified_name: TestStatus.QUEUED},
+        status_codes=bytearray([TEST_STATUS_CODES[TestStatus.QUEUED]]),
     )
 
 
@@ -110,3 +113,100 @@ def test_get_run_returns_job(monkeypatch) -> None:
     payload = response.json()
     assert payload["id"] == job.id
     assert payload["status"] == JobStatus.RUNNING.value
+
+
+def test_list_runs_matches_job_resource_schema(monkeypatch) -> None:
+    job = _make_job(status=JobStatus.RUNNING)
+
+    class DummyQueue:
+        def list_jobs(self):
+            return [job]
+
+    monkeypatch.setattr(routes, "job_queue", DummyQueue(), raising=False)
+
+    response = client.get("/testing/runs")
+
+    assert response.status_code == 200
+    assert response.json() == [JobResource.from_job(job).model_dump(mode="json")]
+
+
+def test_runs_stream_sends_snapshot_as_binary_frame(monkeypatch) -> None:
+    job = _make_job()
+
+    class DummyQueue:
+        def list_jobs(self):
+            return [job]
+
+    monkeypatch.setattr(routes, "job_queue", DummyQueue(), raising=False)
+
+    with client.websocket_connect("/testing/ws/runs") as websocket:
+        event = websocket.receive_json(mode="binary")
+
+    assert event == {"type": "snapshot", "jobs": [JobResource.from_job(job).model_dump(mode="json")]}
+
+
+def test_get_run_renders_job_error(monkeypatch) -> None:
+    job = _make_job(status=JobStatus.FAILED)
+    job.error = JobError(traceback.TracebackException.from_exception(RuntimeError("worker crashed")))
+
+    class DummyQueue:
+        def get_job(self, job_id: str):
+            return job if job_id == job.id else None
+
+    monkeypatch.setattr(routes, "job_queue", DummyQueue(), raising=False)
+
+    response = client.get(f"/testing/runs/{job.id}")
+
+    assert response.status_code == 200
+    assert response.json()["error"] == "RuntimeError: worker crashed\n"
+
+
+def test_test_load_error_returns_formatted_cause(monkeypatch) -> None:
+    def failing_load(*args, **kwargs):
+        try:
+            raise SyntaxError("bad syntax")
+        except SyntaxError as exc:
+            raise TestLoadError("Failed to load tests") from exc
+
+    monkeypatch.setattr(routes, "load_from_qualified_name", failing_load)
+
+    response = client.get("/testing/tests")
+
+    assert response.status_code == 422
+    assert response.headers["content-type"] == "application/json"
+    detail = response.json()["detail"]
+    assert detail.startswith("Failed to load tests:")
+    assert "SyntaxError: bad syntax" in detail
+
+
+def test_unknown_test_error_returns_not_found(monkeypatch) -> None:
+    def missing_load(*args, **kwargs):
+        raise UnknownTestError("Could not resolve qualified name: 'pkg.missing'")
+
+    monkeypatch.setattr(routes, "load_from_qualified_name", missing_load)
+
+    response = client.get("/testing/tests")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Could not resolve qualified name: 'pkg.missing'"}
+
+
+def test_get_history_serializes_latest_results(monkeypatch) -> None:
+    result = TestResultModel(
+        qualified_name="pkg.tests.test_example",
+        module="pkg.tests",
+        name="test_example",
+        passed=True,
+        duration=0.5,
+    )
+
+    class DummyStore:
+        def get_latest_results(self):
+            return {result.qualified_name: result}
+
+    monkeypatch.setattr(routes, "test_run_store", DummyStore(), raising=False)
+
+    response = client.get("/testing/history")
+
+    assert response.status_code == 200
+    assert response.json() == {result.qualified_name: result.model_dump(mode="json")}
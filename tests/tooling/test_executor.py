@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+import types
 from collections.abc import Callable
 from typing import Any
 
@@ -111,3 +114,25 @@ class TestInvokeTool:
         # Plain function without invoke method
         result = invoke_tool(multiply, {"x": 3, "y": 4})
         assert result == 12
+
+    def test_invoke_async_tool_uses_uvloop_when_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Async tools run on uvloop's loop when it is importable and not disabled."""
+        created: list[asyncio.AbstractEventLoop] = []
+
+        def new_event_loop() -> asyncio.AbstractEventLoop:
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+        monkeypatch.setitem(sys.modules, "uvloop", types.SimpleNamespace(new_event_loop=new_event_loop))
+        monkeypatch.delenv("GOOSE_DISABLE_UVLOOP", raising=False)
+
+        async def double(x: int) -> int:
+            return x * 2
+
+        assert invoke_tool(double, {"x": 4}) == 8
+        assert len(created) == 1
+
+        monkeypatch.setenv("GOOSE_DISABLE_UVLOOP", "1")
+        assert invoke_tool(double, {"x": 5}) == 10
+        assert len(created) == 1
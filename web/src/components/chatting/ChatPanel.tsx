@@ -5,6 +5,9 @@ import LoadingDots from "../LoadingDots";
 import { MessageCards } from "../MessageCards";
 import { MessageInput } from "./MessageInput";
 
+// Stream events arrive as binary frames of UTF-8 JSON; text frames are still accepted.
+const frameDecoder = new TextDecoder();
+
 interface ChatPanelProps {
   conversationId: string;
   onError: (message: string) => void;
@@ -74,6 +77,7 @@ export function ChatPanel({ conversationId, onError, onConversationUpdate }: Cha
 
       const wsUrl = chattingApi.getWebSocketUrl(conversationId);
       const ws = new WebSocket(wsUrl);
+      ws.binaryType = "arraybuffer";
       wsRef.current = ws;
 
       let accumulatedContent = "";
@@ -86,7 +90,8 @@ export function ChatPanel({ conversationId, onError, onConversationUpdate }: Cha
 
       ws.onmessage = (event) => {
         try {
-          const streamEvent: StreamEvent = JSON.parse(event.data);
+          const raw = typeof event.data === "string" ? event.data : frameDecoder.decode(event.data);
+          const streamEvent: StreamEvent = JSON.parse(raw);
 
           switch (streamEvent.type) {
             case "message":
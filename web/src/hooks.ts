@@ -7,6 +7,9 @@ type RunsStreamMessage =
   | { type: 'snapshot'; jobs: JobResource[] }
   | { type: 'job'; job: JobResource };
 
+// The runs stream sends binary frames of UTF-8 JSON, as the chat stream does.
+const frameDecoder = new TextDecoder();
+
 const sortRuns = (runs: JobResource[]): JobResource[] => {
   return [...runs].sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
 };
@@ -55,9 +58,10 @@ export const useRuns = () => {
     let shouldReconnect = true;
     let retryHandle: number | null = null;
 
-    const handleMessage = (event: MessageEvent<string>) => {
+    const handleMessage = (event: MessageEvent<ArrayBuffer | string>) => {
       try {
-        const payload = JSON.parse(event.data) as RunsStreamMessage;
+        const raw = typeof event.data === 'string' ? event.data : frameDecoder.decode(event.data);
+        const payload = JSON.parse(raw) as RunsStreamMessage;
         if (payload.type === 'snapshot') {
           const jobs = sortRuns(payload.jobs || []);
           queryClient.setQueryData(['runs'], jobs);
@@ -90,6 +94,7 @@ export const useRuns = () => {
 
     const connect = () => {
       ws = new WebSocket(socketUrl);
+      ws.binaryType = 'arraybuffer';
       ws.onmessage = handleMessage;
       ws.onerror = () => {
         ws?.close();